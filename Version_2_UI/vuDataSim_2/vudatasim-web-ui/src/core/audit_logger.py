@@ -1,15 +1,123 @@
 """
 Audit logging system for vuDataSim Web UI
 """
+import atexit
 import json
 import logging
+import mmap
+import os
+import queue
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
 from .config import LOGS_DIR
 
 logger = logging.getLogger(__name__)
 
+WRITE_BUFFER_SIZE = 64 * 1024
+FSYNC_THRESHOLD = 256 * 1024
+WRITER_SHUTDOWN_TIMEOUT = 5.0
+
+_STOP = object()
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+
+if MSGSPEC_AVAILABLE:
+    class AuditEntry(msgspec.Struct):
+        """Fixed-shape audit record, encoded by msgspec's schema-specialized encoder"""
+        timestamp: str
+        user: str
+        action: str
+        details: Dict[str, Any]
+
+    _entry_encoder = msgspec.json.Encoder()
+
+
+# (epoch second, its local ISO string), swapped as one tuple so threads never see a torn pair
+_iso_second_cache = (None, "")
+
+
+def _iso_from_ns(ts_ns: int) -> str:
+    """Format a time.time_ns() value like datetime.fromtimestamp(...).isoformat().
+
+    The seconds part is formatted once per second and reused; only the
+    microseconds are appended per event, so no datetime is built on the write path.
+    """
+    global _iso_second_cache
+    second, remainder_ns = divmod(ts_ns, 1_000_000_000)
+    cached_second, cached_iso = _iso_second_cache
+    if second != cached_second:
+        cached_iso = datetime.fromtimestamp(second).isoformat()
+        _iso_second_cache = (second, cached_iso)
+    microsecond = remainder_ns // 1000
+    if microsecond:
+        return f"{cached_iso}.{microsecond:06d}"
+    return cached_iso
+
+
+def _dumps_line(entry: Dict[str, Any]) -> bytes:
+    """Serialize an audit entry to a newline-terminated JSON line"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(entry) + '\n').encode('utf-8')
+
+
+def _encode_entry(timestamp: str, user: str, action: str, details: Dict[str, Any]) -> bytes:
+    """Encode an audit record as a JSON line, preferring msgspec, then orjson, then json"""
+    if MSGSPEC_AVAILABLE:
+        return _entry_encoder.encode(AuditEntry(timestamp, user, action, details)) + b'\n'
+    return _dumps_line({
+        "timestamp": timestamp,
+        "user": user,
+        "action": action,
+        "details": details
+    })
+
+
+def _loads_line(line: bytes) -> Dict[str, Any]:
+    """Parse a single JSON line read from the audit file"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def _tail_lines(path: Path, limit: int) -> List[bytes]:
+    """Return the last `limit` non-empty lines of a file by scanning a read-only mmap backwards"""
+    if limit <= 0:
+        return []
+
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, 'MADV_RANDOM'):
+                mm.madvise(mmap.MADV_RANDOM)
+
+            lines = []
+            end = len(mm)
+            while end > 0 and len(lines) < limit:
+                start = mm.rfind(b'\n', 0, end) + 1
+                line = mm[start:end]
+                if line.strip():
+                    lines.append(line)
+                end = start - 1
+
+    lines.reverse()
+    return lines
+
 
 class AuditLogger:
     """Audit logging for all operations"""
@@ -17,21 +125,83 @@ class AuditLogger:
     def __init__(self):
         self.audit_file = LOGS_DIR / "audit.jsonl"
         LOGS_DIR.mkdir(exist_ok=True)
+        self._lock = threading.Lock()
+        self._fh = open(self.audit_file, 'ab', buffering=WRITE_BUFFER_SIZE)
+        self._dirty_bytes = 0
+        self._queue = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._writer_loop, name="audit-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _sync(self):
+        """Flush buffered entries and fsync them to disk (caller holds the lock)"""
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        self._dirty_bytes = 0
+
+    def _writer_loop(self):
+        """Drain queued entries and append each batch with a single write"""
+        while True:
+            item = self._queue.get()
+            batch, waiters, stop = [], [], False
+            while True:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            try:
+                with self._lock:
+                    if batch:
+                        payload = b''.join(batch)
+                        self._fh.write(payload)
+                        self._dirty_bytes += len(payload)
+                        if self._dirty_bytes > FSYNC_THRESHOLD:
+                            self._sync()
+                    if waiters:
+                        self._fh.flush()
+            except Exception as e:
+                logger.error(f"Failed to write audit log: {e}")
+
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                return
+
+    def flush(self, timeout: float = WRITER_SHUTDOWN_TIMEOUT):
+        """Wait until every queued audit entry is visible to readers"""
+        if not self._writer.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self):
+        """Drain the writer queue, then fsync and close the audit file"""
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join(WRITER_SHUTDOWN_TIMEOUT)
+        with self._lock:
+            if self._fh.closed:
+                return
+            try:
+                self._sync()
+            finally:
+                self._fh.close()
 
     def log_action(self, action: str, details: Dict[str, Any], user: str = "system"):
         """Log an action to the audit trail"""
-        audit_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "user": user,
-            "action": action,
-            "details": details
-        }
-
         try:
-            with open(self.audit_file, 'a') as f:
-                f.write(json.dumps(audit_entry) + '\n')
+            self._queue.put(_encode_entry(_iso_from_ns(time.time_ns()), user, action, details))
 
-            logger.info(f"Audit: {action} by {user}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Audit: %s by %s", action, user)
         except Exception as e:
             logger.error(f"Failed to write audit log: {e}")
 
@@ -62,11 +232,11 @@ class AuditLogger:
         if not self.audit_file.exists():
             return []
 
+        self.flush()
         entries = []
         try:
-            with open(self.audit_file, 'r') as f:
-                for line in f.readlines()[-limit:]:
-                    entries.append(json.loads(line.strip()))
+            for line in _tail_lines(self.audit_file, limit):
+                entries.append(_loads_line(line))
         except Exception as e:
             logger.error(f"Error reading audit history: {e}")
 
@@ -6,6 +6,7 @@ import time
 import signal
 import logging
 import subprocess
+import threading
 import paramiko
 from pathlib import Path
 from datetime import datetime
@@ -17,6 +18,12 @@ from .config import (
 
 logger = logging.getLogger(__name__)
 
+# Bytes of a remote log fetched by default when viewing it
+REMOTE_LOG_TAIL_BYTES = 65536
+
+# Keepalive interval for the shared SSH connection, so idle periods between page refreshes don't drop it
+SSH_KEEPALIVE_SECONDS = 30
+
 
 class ProcessManager:
     """Manages vuDataSim binary processes"""
@@ -24,6 +31,9 @@ class ProcessManager:
     def __init__(self):
         self.processes: Dict[str, Dict[str, Any]] = {}
         self.log_counter = 0
+        self._ssh: Optional[paramiko.SSHClient] = None
+        # Remote calls may run on several threads at once; they must share one connection
+        self._ssh_lock = threading.Lock()
 
     def _get_binary_path(self, binary_name: str) -> Path:
         """Get full path to binary"""
@@ -265,7 +275,16 @@ class ProcessManager:
             logger.info(f"Cleaned up finished process: {binary_name}")
 
     def _get_ssh_client(self) -> paramiko.SSHClient:
-        """Create and configure SSH client for remote connections"""
+        """Get the shared SSH client for remote connections, reconnecting if it has dropped"""
+        with self._ssh_lock:
+            transport = self._ssh.get_transport() if self._ssh else None
+            if transport is not None and transport.is_active():
+                return self._ssh
+            self.close_remote_connection()
+            return self._connect_ssh()
+
+    def _connect_ssh(self) -> paramiko.SSHClient:
+        """Open a new SSH connection to the remote host and keep it as the shared client"""
         ssh = paramiko.SSHClient()
         ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
 
@@ -279,11 +298,22 @@ class ProcessManager:
                 key_filename=expanded_key_path,
                 timeout=10
             )
+            ssh.get_transport().set_keepalive(SSH_KEEPALIVE_SECONDS)
+            self._ssh = ssh
             return ssh
         except Exception as e:
             logger.error(f"Failed to connect to remote host {REMOTE_HOST}: {e}")
             raise
 
+    def close_remote_connection(self):
+        """Close the shared SSH connection to the remote host"""
+        if self._ssh is not None:
+            try:
+                self._ssh.close()
+            except Exception:
+                pass
+            self._ssh = None
+
     def list_remote_binaries(self) -> list:
         """List available binaries on remote host"""
         try:
@@ -300,7 +330,6 @@ class ProcessManager:
                     binary_name.replace('_', '').replace('-', '').isalnum()):
                     binaries.append(binary_name)
 
-            ssh.close()
             return sorted(binaries)  # Return sorted list for consistent ordering
 
         except Exception as e:
@@ -369,7 +398,6 @@ class ProcessManager:
 
             # Store process info immediately
             self.processes[f"remote_{binary_name}"] = {
-                "ssh": ssh,
                 "run_id": run_id,
                 "start_time": datetime.now(),
                 "timeout": timeout,
@@ -439,15 +467,13 @@ class ProcessManager:
             }
 
         try:
-            ssh = process_info["ssh"]
+            ssh = self._get_ssh_client()
 
             # Kill the remote process
             pid = process_info.get("pid")
             if pid:
-                ssh.exec_command(f"kill {pid}")
-
-            # Close SSH connection
-            ssh.close()
+                _, stdout, _ = ssh.exec_command(f"kill {pid}")
+                stdout.channel.recv_exit_status()
 
             # Update process info
             process_info.update({
@@ -482,11 +508,7 @@ class ProcessManager:
 
         try:
             # Check if process is still running on remote host
-            # Reuse existing SSH connection if available, otherwise create new one
-            ssh = process_info.get("ssh")
-            if not ssh or not ssh.get_transport() or not ssh.get_transport().is_active():
-                ssh = self._get_ssh_client()
-                process_info["ssh"] = ssh
+            ssh = self._get_ssh_client()
             
             pid = process_info.get("pid")
 
@@ -554,14 +576,9 @@ class ProcessManager:
                 "error": str(e),
                 "message": f"Error checking status of remote {binary_name}"
             }
-        finally:
-            try:
-                ssh.close()
-            except Exception:
-                pass
 
-    def get_remote_logs(self, binary_name: str) -> str:
-        """Retrieve logs from remote binary"""
+    def get_remote_logs(self, binary_name: str, max_bytes: int = REMOTE_LOG_TAIL_BYTES) -> str:
+        """Retrieve the last max_bytes of a remote binary's log"""
         remote_key = f"remote_{binary_name}"
 
         if remote_key not in self.processes:
@@ -576,10 +593,17 @@ class ProcessManager:
         try:
             ssh = self._get_ssh_client()
             sftp = ssh.open_sftp()
-            with sftp.file(remote_log_file, 'r') as f:
-                logs = f.read().decode('utf-8', errors='ignore')
-            sftp.close()
-            ssh.close()
+            try:
+                with sftp.file(remote_log_file, 'r') as f:
+                    # Only the tail crosses the network, however large the log has grown
+                    offset = max(0, f.stat().st_size - max_bytes)
+                    f.seek(offset)
+                    logs = f.read().decode('utf-8', errors='ignore')
+                if offset:
+                    # Drop the line cut off by the offset
+                    logs = logs.partition('\n')[2]
+            finally:
+                sftp.close()
             return logs
 
         except Exception as e:
@@ -2,7 +2,9 @@
 ClickHouse monitoring module for live EPS tracking (direct connection)
 """
 import logging
-from typing import Dict, Optional, Tuple
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
@@ -16,6 +18,16 @@ except ImportError:
         "clickhouse-driver not available. Install with: pip install clickhouse-driver>=0.2.7"
     )
 
+try:
+    import lz4  # noqa: F401
+    import clickhouse_cityhash  # noqa: F401
+    LZ4_COMPRESSION_AVAILABLE = True
+except ImportError:
+    LZ4_COMPRESSION_AVAILABLE = False
+
+# A connection idle for longer than this is pinged before reuse; busier ones go straight to the query
+IDLE_PING_SECONDS = 30.0
+
 
 class ClickHouseMonitor:
     """Monitor ClickHouse for Kafka metrics via direct connection"""
@@ -27,94 +39,193 @@ class ClickHouseMonitor:
         database: str = "monitoring",
         user: str = "default",
         password: str = "",
+        compression: Optional[str] = "lz4",
+        cache_ttl: float = 1.0,
     ):
         self.host = host
         self.port = port
         self.database = database
         self.user = user
         self.password = password
+        # lz4 needs the clickhouse-driver[lz4] extras; fall back to an uncompressed stream without them
+        if compression == "lz4" and not LZ4_COMPRESSION_AVAILABLE:
+            compression = None
+        self.compression = compression
+        # Results keyed by (topic, metric set); metrics only change about once a second
+        self._cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        self._cache_ttl = cache_ttl
+        self._cache_lock = threading.Lock()
         self.client: Optional[Client] = None
+        self._last_used = 0.0
+        # The driver's Client is not thread-safe; one monitor is shared by every session thread
+        self._client_lock = threading.RLock()
 
     def connect(self) -> bool:
         """Establish connection to ClickHouse server"""
-        if not CLICKHOUSE_DRIVER_AVAILABLE:
-            logger.error(
-                "clickhouse-driver package is not installed. Please install it with: pip install clickhouse-driver>=0.2.7"
-            )
-            return False
+        with self._client_lock:
+            if not CLICKHOUSE_DRIVER_AVAILABLE:
+                logger.error(
+                    "clickhouse-driver package is not installed. Please install it with: pip install clickhouse-driver>=0.2.7"
+                )
+                return False
 
-        try:
-            self.client = Client(
-                host=self.host,
-                port=self.port,
-                database=self.database,
-                user=self.user,
-                password=self.password,
-            )
-            # Test connection
-            self.client.execute("SELECT 1")
-            logger.info(f"Connected to ClickHouse at {self.host}:{self.port}, database: {self.database}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to connect to ClickHouse at {self.host}:{self.port}: {e}")
-            self.client = None
-            return False
+            try:
+                self.client = Client(
+                    host=self.host,
+                    port=self.port,
+                    database=self.database,
+                    user=self.user,
+                    password=self.password,
+                    compression=self.compression or False,
+                )
+                # Test connection
+                self.client.execute("SELECT 1")
+                logger.info(f"Connected to ClickHouse at {self.host}:{self.port}, database: {self.database}")
+                return True
+            except Exception as e:
+                logger.error(f"Failed to connect to ClickHouse at {self.host}:{self.port}: {e}")
+                self.client = None
+                return False
 
     def disconnect(self):
         """Close ClickHouse connection"""
-        if self.client:
-            self.client.disconnect()
-            self.client = None
-            logger.info("Disconnected from ClickHouse server")
+        with self._client_lock:
+            if self.client:
+                try:
+                    self.client.disconnect()
+                except Exception as e:
+                    logger.debug(f"Error while closing ClickHouse connection: {e}")
+                self.client = None
+                logger.info("Disconnected from ClickHouse server")
 
-    def execute_query(self, query: str) -> Tuple[bool, str]:
-        """Execute a ClickHouse query"""
-        if not self.client:
-            return False, "Not connected to ClickHouse"
+    def _ensure_connected(self) -> bool:
+        """Reuse the cached client, pinging it after an idle spell and reconnecting lazily if the link dropped"""
+        now = time.monotonic()
+        if self.client is not None:
+            if now - self._last_used < IDLE_PING_SECONDS:
+                self._last_used = now
+                return True
+            try:
+                if self.client.connection.ping():
+                    self._last_used = now
+                    return True
+            except Exception as e:
+                logger.debug(f"ClickHouse ping failed: {e}")
+            logger.info(f"ClickHouse connection to {self.host}:{self.port} lost, reconnecting")
+            self.disconnect()
+        if not self.connect():
+            return False
+        self._last_used = time.monotonic()
+        return True
 
-        try:
-            result = self.client.execute(query)
-            if not result:
-                return True, ""
-
-            # Flatten tuples if needed
-            output_lines = []
-            for row in result:
-                if isinstance(row, tuple):
-                    output_lines.append("\t".join(str(v) for v in row))
-                else:
-                    output_lines.append(str(row))
-            return True, "\n".join(output_lines)
+    def _cache_get(self, key: Tuple[str, str]) -> Optional[Any]:
+        """Return a cached result if it is younger than the TTL"""
+        with self._cache_lock:
+            cached_at, value = self._cache.get(key, (0.0, None))
+        if value is not None and time.monotonic() - cached_at < self._cache_ttl:
+            return value
+        return None
+
+    def _cache_put(self, key: Tuple[str, str], value: Any):
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), value)
+
+    def clear_cache(self):
+        """Drop all cached topic results"""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def execute_query(self, query: str, params: Optional[Dict[str, Any]] = None) -> Tuple[bool, List[tuple], str]:
+        """Execute a ClickHouse query, binding `params` to its %(name)s placeholders.
+
+        Returns the driver's typed rows untouched.
+        """
+        with self._client_lock:
+            if not self._ensure_connected():
+                return False, [], "Not connected to ClickHouse"
+
+            try:
+                return True, self.client.execute(query, params), "Success"
+            except Exception as e:
+                logger.error(f"Query execution failed: {e}")
+                return False, [], str(e)
 
+    def iter_query(self, query: str, params: Optional[Dict[str, Any]] = None) -> Iterator[tuple]:
+        """Stream rows of a (potentially large) result set without materializing it.
+
+        Errors surface while iterating, so callers should wrap the loop in try/except.
+        The client stays locked until the rows are exhausted or the iterator is closed.
+        """
+        with self._client_lock:
+            if not self._ensure_connected():
+                raise ConnectionError("Not connected to ClickHouse")
+            yield from self.client.execute_iter(query, params)
+
+    @staticmethod
+    def _format_row(row: Any) -> str:
+        if isinstance(row, tuple):
+            return "\t".join(str(v) for v in row)
+        return str(row)
+
+    def execute_query_text(self, query: str, params: Optional[Dict[str, Any]] = None) -> Tuple[bool, str]:
+        """Execute a query and render rows as tab-separated text, for interactive output"""
+        try:
+            # Rows are streamed straight into the joined output instead of buffered as a list first
+            return True, "\n".join(self._format_row(row) for row in self.iter_query(query, params))
         except Exception as e:
             logger.error(f"Query execution failed: {e}")
             return False, str(e)
 
     def get_eps_for_topic(self, topic: str) -> Tuple[bool, Optional[float], str]:
         """Get the current OneMinuteRate (EPS) for a specific Kafka topic"""
-        query = f"""
+        cached = self._cache_get((topic, "eps"))
+        if cached is not None:
+            return True, cached, "Success (cached)"
+
+        query = """
         SELECT OneMinuteRate
         FROM kafka_Broker_Topic_Metrics_data
-        WHERE topic = '{topic}'
+        WHERE topic = %(topic)s
         ORDER BY timestamp DESC
         LIMIT 1
         """
-        success, result = self.execute_query(query)
+        success, rows, message = self.execute_query(query, {"topic": topic})
         if not success:
-            return False, None, result
+            return False, None, message
 
-        try:
-            if result.strip():
-                eps_value = float(result.strip())
-                return True, eps_value, "Success"
-            else:
-                return False, None, "No data found for topic"
-        except ValueError as e:
-            return False, None, f"Failed to parse EPS value: {e}"
+        if not rows:
+            return False, None, "No data found for topic"
+        eps_value = rows[0][0]
+        self._cache_put((topic, "eps"), eps_value)
+        return True, eps_value, "Success"
+
+    def get_eps_for_topics(self, topics: List[str]) -> Tuple[bool, Dict[str, float], str]:
+        """Get the latest OneMinuteRate for several topics in a single grouped query"""
+        if not topics:
+            return True, {}, "Success"
+
+        query = """
+        SELECT topic, argMax(OneMinuteRate, timestamp)
+        FROM kafka_Broker_Topic_Metrics_data
+        WHERE topic IN %(topics)s
+        GROUP BY topic
+        """
+        success, rows, message = self.execute_query(query, {"topics": tuple(topics)})
+        if not success:
+            return False, {}, message
+
+        eps_by_topic = {topic: eps_value for topic, eps_value in rows}
+        for topic, eps_value in eps_by_topic.items():
+            self._cache_put((topic, "eps"), eps_value)
+        return True, eps_by_topic, "Success"
 
     def get_topic_metrics(self, topic: str) -> Tuple[bool, Optional[Dict], str]:
         """Get comprehensive metrics for a topic"""
-        query = f"""
+        cached = self._cache_get((topic, "metrics"))
+        if cached is not None:
+            return True, dict(cached), "Success (cached)"
+
+        query = """
         SELECT
             OneMinuteRate,
             FiveMinuteRate,
@@ -123,30 +234,27 @@ class ClickHouseMonitor:
             Count,
             timestamp
         FROM kafka_Broker_Topic_Metrics_data
-        WHERE topic = '{topic}'
+        WHERE topic = %(topic)s
         ORDER BY timestamp DESC
         LIMIT 1
         """
-        success, result = self.execute_query(query)
+        success, rows, message = self.execute_query(query, {"topic": topic})
         if not success:
-            return False, None, result
+            return False, None, message
 
-        try:
-            fields = result.strip().split("\t")
-            if len(fields) >= 6:
-                metrics = {
-                    "one_minute_rate": float(fields[0]),
-                    "five_minute_rate": float(fields[1]),
-                    "fifteen_minute_rate": float(fields[2]),
-                    "mean_rate": float(fields[3]),
-                    "count": float(fields[4]),
-                    "timestamp": fields[5],
-                }
-                return True, metrics, "Success"
-            else:
-                return False, None, "Incomplete data received"
-        except (ValueError, IndexError) as e:
-            return False, None, f"Failed to parse metrics: {e}"
+        if not rows or len(rows[0]) < 6:
+            return False, None, "Incomplete data received"
+        row = rows[0]
+        metrics = {
+            "one_minute_rate": row[0],
+            "five_minute_rate": row[1],
+            "fifteen_minute_rate": row[2],
+            "mean_rate": row[3],
+            "count": row[4],
+            "timestamp": row[5],
+        }
+        self._cache_put((topic, "metrics"), metrics)
+        return True, dict(metrics), "Success"
 
     def __enter__(self):
         self.connect()
@@ -168,10 +276,10 @@ if __name__ == "__main__":
         password="StrongPassword123"
     )
 
-    if clickhouse_monitor.connect():
-        success, eps, msg = clickhouse_monitor.get_eps_for_topic("azuresql-single-database-jdbc-metrics")
-        if success:
-            logger.info(f"Current EPS for topic: {eps}")
-        else:
-            logger.warning(f"Failed to get EPS: {msg}")
-        clickhouse_monitor.disconnect()
+    # The connection is opened on first use and kept for subsequent queries
+    success, eps, msg = clickhouse_monitor.get_eps_for_topic("azuresql-single-database-jdbc-metrics")
+    if success:
+        logger.info(f"Current EPS for topic: {eps}")
+    else:
+        logger.warning(f"Failed to get EPS: {msg}")
+    clickhouse_monitor.disconnect()
@@ -6,17 +6,190 @@ import os
 import yaml
 import logging
 import hashlib
+import io
+import json
+import queue
+import re
+import shlex
 import shutil
+import stat
+import tarfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
 import paramiko
 from paramiko import SSHClient, SFTPClient
-import tempfile
 import time
 
+try:
+    from ruamel.yaml import YAML
+    RUAMEL_AVAILABLE = True
+except ImportError:
+    RUAMEL_AVAILABLE = False
+
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml C bindings; fall back to the pure-Python implementation
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    LIBYAML_AVAILABLE = True
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+    LIBYAML_AVAILABLE = False
+
+# Block size for streaming SFTP transfers
+SFTP_COPY_BUFFER_SIZE = 1 << 20
+
+# Parsed-YAML cache written next to each node snapshot; bump the version on format changes
+PARSED_CACHE_FILE = "_parsed.json"
+PARSED_CACHE_VERSION = 1
+
+# SFTP channels opened on one SSH transport when pushing a node's snapshot
+MAX_PUSH_CHANNELS = 8
+
+# Downloaded files buffered for the writer threads during an SFTP snapshot sync
+WRITE_QUEUE_SIZE = 32
+
+# Snapshot checksum algorithm, recorded in checksums.yaml alongside the digests
+CHECKSUM_ALGORITHM = 'blake3' if BLAKE3_AVAILABLE else 'sha256'
+CHECKSUM_BLOCK_SIZE = 1 << 20
+
+def _new_hasher():
+    """Create a hasher for CHECKSUM_ALGORITHM"""
+    return blake3.blake3() if BLAKE3_AVAILABLE else hashlib.sha256()
+
+def _sha256_file(file_path: Path) -> str:
+    """SHA-256 of a local file, comparable with a remote sha256sum"""
+    with open(file_path, "rb", buffering=0) as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        hasher = hashlib.sha256()
+        for chunk in iter(lambda: f.read(CHECKSUM_BLOCK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+def _find_files(root: Path, suffixes: Tuple[str, ...]) -> List[Path]:
+    """
+    Collect files under root whose names end with one of suffixes
+    
+    A single os.scandir walk: DirEntry carries the file type from readdir, so
+    unlike a pair of rglob calls the tree is read once and nothing is stat'ed.
+    """
+    found = []
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(suffixes) and entry.is_file():
+                    found.append(Path(entry.path))
+    return found
+
+# An indented, uncommented 'NumUniqKey: <int>' line and the top-level 'uniquekey:' key.
+# The value must be plain decimal digits running to end of line or a comment, so
+# shapes like 0x10, 1.5 or 1_000 fall through to the full YAML edit.
+NUM_UNIQ_KEY_RE = re.compile(rb'(?m)^([ \t]+NumUniqKey:[ \t]*)(\d+)(?=[ \t]+#|[ \t]*\r?$)')
+UNIQUE_KEY_SECTION_RE = re.compile(rb'(?m)^uniquekey:[ \t]*(?:#.*)?\r?$')
+TOP_LEVEL_LINE_RE = re.compile(rb'(?m)^[^\s#]')
+
+def _patch_num_uniq_key(content: bytes, new_value: int) -> Optional[bytes]:
+    """
+    Rewrite uniquekey.NumUniqKey in place, keeping comments and formatting
+    
+    Returns None unless the file has exactly one NumUniqKey line and it sits
+    inside the top-level uniquekey block; the caller then does a full YAML edit.
+    """
+    match = NUM_UNIQ_KEY_RE.search(content)
+    if match is None or NUM_UNIQ_KEY_RE.search(content, match.end()) is not None:
+        return None
+    section = None
+    for section in UNIQUE_KEY_SECTION_RE.finditer(content, 0, match.start()):
+        pass
+    if section is None or TOP_LEVEL_LINE_RE.search(content, section.end(), match.start()):
+        return None
+    return b''.join((content[:match.start(2)], str(new_value).encode('ascii'), content[match.end(2):]))
+
+def _read_unique_key_block(file_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Parse only the top-level uniquekey block of a YAML file
+    
+    Reading stops at the first top-level line after the block, so the rest of
+    the file is neither read past nor parsed. Returns None if the block is not
+    in plain block style (or is absent), leaving the caller to parse the file.
+    """
+    block = []
+    with open(file_path, 'rb') as f:
+        for line in f:
+            if block:
+                if TOP_LEVEL_LINE_RE.match(line):
+                    break
+                block.append(line)
+            elif UNIQUE_KEY_SECTION_RE.match(line):
+                block.append(line)
+    if not block:
+        return None
+    try:
+        parsed = yaml.load(b''.join(block), Loader=SafeLoader)
+    except yaml.YAMLError:
+        return None
+    if not isinstance(parsed, dict) or not isinstance(parsed.get('uniquekey'), dict):
+        return None
+    return parsed['uniquekey']
+
+def _round_trip_yaml() -> 'YAML':
+    """Create a ruamel round-trip YAML instance; instances are not thread-safe"""
+    round_trip = YAML()
+    round_trip.preserve_quotes = True
+    round_trip.width = 4096
+    return round_trip
+
+def _is_json_native(value) -> bool:
+    """Check that a parsed YAML value survives a JSON round trip unchanged"""
+    if value is None or isinstance(value, (str, bool, int)):
+        return True
+    if isinstance(value, float):
+        return value == value and value not in (float('inf'), float('-inf'))
+    if isinstance(value, list):
+        return all(_is_json_native(item) for item in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _is_json_native(v) for k, v in value.items())
+    return False
+
+def _copy_and_hash(src, dst) -> str:
+    """Copy src to dst in large blocks, hashing the bytes on the way through"""
+    hasher = _new_hasher()
+    while True:
+        chunk = src.read(SFTP_COPY_BUFFER_SIZE)
+        if not chunk:
+            break
+        dst.write(chunk)
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+# Per-channel SSH flow-control window and maximum packet size (paramiko defaults: 2 MiB / 32 KiB)
+SSH_WINDOW_SIZE = 1 << 27
+SSH_MAX_PACKET_SIZE = 1 << 19
+
+# Seconds an idle pooled SSH connection is kept before being closed
+SSH_POOL_IDLE_TIMEOUT = 300
+
+# Upper bound on nodes edited concurrently by the all-nodes bulk operations
+MAX_NODE_WORKERS = 32
+
+# Upper bound on submodule files fetched concurrently over one node's SFTP session
+MAX_SUBMODULE_WORKERS = 16
+
 class NodeConnectionError(Exception):
     """Exception raised when node connection fails"""
     pass
@@ -49,11 +222,38 @@ class ClusterManager:
         
         # Setup cluster-specific logging
         self._setup_cluster_logging()
+        logger.info(f"YAML backend: {'libyaml C bindings' if LIBYAML_AVAILABLE else 'pure Python (libyaml not found)'}")
         
         # Load node configurations
         self.nodes_config = self._load_nodes_config()
         self.cluster_settings = self.nodes_config.get('cluster_settings', {})
         
+        # Direct reference to nodes_config['nodes']; add/remove mutate this same dict
+        self._nodes: Dict[str, Dict[str, Any]] = self.nodes_config['nodes']
+        
+        # Idle SSH/SFTP connections keyed by (host, user, key_path)
+        self._pool: Dict[Tuple[str, str, str], List[Tuple[SSHClient, SFTPClient, float]]] = {}
+        self._pool_lock = threading.Lock()
+        
+        # Parsed YAML keyed by path: (mtime_ns, size, config_data, raw_content)
+        self._yaml_cache: Dict[str, Tuple[int, int, Any, str]] = {}
+        
+        # Nodes whose on-disk parsed-YAML cache has been loaded, and a count of real parses
+        self._parsed_cache_loaded: set = set()
+        self._yaml_parse_count = 0
+        
+        # Module-level NumUniqKey keyed by (node, module): ((mtime_ns, size) of conf.yml, value)
+        self._module_key_cache: Dict[Tuple[str, str], Tuple[Tuple[int, int], int]] = {}
+        
+        # get_all_submodule_configs results keyed by node: (snapshot signature, configs)
+        self._submodule_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Dict[str, Any]]]] = {}
+        
+        # Snapshot used when no node is given; reset whenever a snapshot is refreshed
+        self._default_snapshot_node: Optional[str] = None
+        
+        # (snapshot dir, snapshot conf.d dir) per node, built once
+        self._snapshot_dir_cache: Dict[str, Tuple[Path, Path]] = {}
+        
     def _setup_cluster_logging(self):
         """Setup logging for cluster operations"""
         cluster_logger = logging.getLogger('cluster_sync')
@@ -80,10 +280,10 @@ class ClusterManager:
                 return {'nodes': {}, 'cluster_settings': {}}
                 
             with open(self.nodes_file, 'r') as f:
-                config = yaml.safe_load(f) or {}
+                config = yaml.load(f, Loader=SafeLoader) or {}
                 
             # Validate configuration structure
-            if 'nodes' not in config:
+            if not isinstance(config.get('nodes'), dict):
                 config['nodes'] = {}
             if 'cluster_settings' not in config:
                 config['cluster_settings'] = self._get_default_cluster_settings()
@@ -101,12 +301,16 @@ class ClusterManager:
             'sync_timeout': 60,
             'connection_timeout': 10,
             'max_retries': 3,
-            'conflict_resolution': 'manual'
+            'conflict_resolution': 'manual',
+            'max_concurrent_requests': 64,
+            'compress': True,
+            'ssh_window_size': SSH_WINDOW_SIZE,
+            'ssh_max_packet_size': SSH_MAX_PACKET_SIZE
         }
     
     def get_nodes(self) -> Dict[str, Dict[str, Any]]:
         """Get all configured nodes"""
-        return self.nodes_config.get('nodes', {})
+        return self._nodes
     
     def get_enabled_nodes(self) -> Dict[str, Dict[str, Any]]:
         """Get only enabled nodes"""
@@ -134,10 +338,7 @@ class ClusterManager:
             bool: Success status
         """
         try:
-            if 'nodes' not in self.nodes_config:
-                self.nodes_config['nodes'] = {}
-                
-            self.nodes_config['nodes'][name] = {
+            self._nodes[name] = {
                 'host': host,
                 'user': user,
                 'key_path': key_path,
@@ -149,7 +350,7 @@ class ClusterManager:
             
             # Save updated configuration
             with open(self.nodes_file, 'w') as f:
-                yaml.dump(self.nodes_config, f, default_flow_style=False)
+                yaml.dump(self.nodes_config, f, Dumper=SafeDumper, default_flow_style=False)
                 
             logger.info(f"Added node {name} to configuration")
             return True
@@ -161,15 +362,16 @@ class ClusterManager:
     def remove_node(self, name: str) -> bool:
         """Remove a node from the configuration"""
         try:
-            if name in self.nodes_config.get('nodes', {}):
-                del self.nodes_config['nodes'][name]
+            if name in self._nodes:
+                del self._nodes[name]
                 
                 # Save updated configuration
                 with open(self.nodes_file, 'w') as f:
-                    yaml.dump(self.nodes_config, f, default_flow_style=False)
+                    yaml.dump(self.nodes_config, f, Dumper=SafeDumper, default_flow_style=False)
                     
                 # Clean up snapshots and backups
-                node_snapshot_dir = self.conf_snapshots_dir / name
+                node_snapshot_dir, _ = self._snapshot_dirs(name)
+                self._snapshot_dir_cache.pop(name, None)
                 node_backup_dir = self.backups_dir / name
                 
                 if node_snapshot_dir.exists():
@@ -214,9 +416,16 @@ class ClusterManager:
                 hostname=node_config['host'],
                 username=node_config['user'],
                 key_filename=key_path,
-                timeout=timeout
+                timeout=timeout,
+                compress=self.cluster_settings.get('compress', True)
             )
             
+            # Larger windows/packets for the SFTP and exec channels opened on this transport,
+            # so transfers are not capped at window/RTT on high-latency links
+            transport = ssh.get_transport()
+            transport.default_window_size = self.cluster_settings.get('ssh_window_size', SSH_WINDOW_SIZE)
+            transport.default_max_packet_size = self.cluster_settings.get('ssh_max_packet_size', SSH_MAX_PACKET_SIZE)
+            
             # Create SFTP client
             sftp = ssh.open_sftp()
             
@@ -228,20 +437,126 @@ class ClusterManager:
             self.cluster_logger.error(error_msg)
             raise NodeConnectionError(error_msg)
     
+    def _pool_key(self, node_config: Dict[str, Any]) -> Tuple[str, str, str]:
+        """Build the connection pool key for a node"""
+        return (node_config['host'], node_config['user'],
+                os.path.expanduser(node_config['key_path']))
+
+    @staticmethod
+    def _close_connection(ssh: SSHClient, sftp: SFTPClient):
+        """Close an SSH/SFTP pair, ignoring errors from dead transports"""
+        for conn in (sftp, ssh):
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def _reap_idle(self, max_age: float = SSH_POOL_IDLE_TIMEOUT):
+        """Close pooled connections that have been idle longer than max_age seconds"""
+        cutoff = time.monotonic() - max_age
+        stale = []
+        with self._pool_lock:
+            for key, entries in self._pool.items():
+                fresh = [entry for entry in entries if entry[2] >= cutoff]
+                stale.extend(entry for entry in entries if entry[2] < cutoff)
+                self._pool[key] = fresh
+        for ssh, sftp, _ in stale:
+            self._close_connection(ssh, sftp)
+
+    @contextmanager
+    def _acquire(self, node_config: Dict[str, Any]):
+        """
+        Check out an SSH/SFTP connection to a node, reusing an idle one if possible
+        
+        The connection is returned to the pool when the block exits cleanly and
+        closed if the block raises, so a broken session is never reused.
+        
+        Args:
+            node_config: Node configuration dictionary
+            
+        Yields:
+            Tuple of (SSHClient, SFTPClient)
+            
+        Raises:
+            NodeConnectionError: If a new connection cannot be established
+        """
+        self._reap_idle()
+        key = self._pool_key(node_config)
+        conn = None
+        with self._pool_lock:
+            idle = self._pool.get(key, [])
+            while idle:
+                ssh, sftp, _ = idle.pop()
+                transport = ssh.get_transport()
+                if transport is not None and transport.is_active():
+                    conn = (ssh, sftp)
+                    break
+                self._close_connection(ssh, sftp)
+        if conn is None:
+            conn = self._create_ssh_connection(node_config)
+        
+        try:
+            yield conn
+        except BaseException:
+            self._close_connection(*conn)
+            raise
+        else:
+            with self._pool_lock:
+                self._pool.setdefault(key, []).append((conn[0], conn[1], time.monotonic()))
+
+    def close_all(self):
+        """Close every pooled SSH/SFTP connection"""
+        with self._pool_lock:
+            entries = [entry for conns in self._pool.values() for entry in conns]
+            self._pool.clear()
+        for ssh, sftp, _ in entries:
+            self._close_connection(ssh, sftp)
+    
+    def _sftp_read(self, sftp: SFTPClient, remote_path: str) -> bytes:
+        """Read a whole remote file into memory with read-ahead prefetch"""
+        max_requests = self.cluster_settings.get('max_concurrent_requests', 64)
+        with sftp.open(remote_path, 'rb') as remote_file:
+            remote_file.prefetch(max_concurrent_requests=max_requests)
+            return remote_file.read()
+
+    def _sftp_download(self, sftp: SFTPClient, remote_path: str, local_path: Path) -> str:
+        """
+        Download a file with read-ahead prefetch so SFTP read requests overlap
+        
+        Returns:
+            Checksum of the downloaded bytes, computed while writing them
+        """
+        max_requests = self.cluster_settings.get('max_concurrent_requests', 64)
+        with sftp.open(remote_path, 'rb') as remote_file:
+            remote_file.prefetch(max_concurrent_requests=max_requests)
+            with open(local_path, 'wb') as local_file:
+                return _copy_and_hash(remote_file, local_file)
+
+    def _sftp_upload(self, sftp: SFTPClient, local_path: Path, remote_path: str):
+        """Upload a file with pipelined writes instead of waiting for each write ACK"""
+        with open(local_path, 'rb') as local_file:
+            with sftp.open(remote_path, 'wb') as remote_file:
+                remote_file.set_pipelined(True)
+                shutil.copyfileobj(local_file, remote_file, length=SFTP_COPY_BUFFER_SIZE)
+
     def _calculate_checksum(self, file_path: Path) -> str:
-        """Calculate MD5 checksum of a file"""
-        hash_md5 = hashlib.md5()
+        """Calculate the CHECKSUM_ALGORITHM digest of a file"""
         try:
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+            with open(file_path, "rb", buffering=0) as f:
+                if not BLAKE3_AVAILABLE and hasattr(hashlib, 'file_digest'):
+                    # Python 3.11+: hashes in C with the GIL released
+                    return hashlib.file_digest(f, 'sha256').hexdigest()
+                hasher = _new_hasher()
+                for chunk in iter(lambda: f.read(CHECKSUM_BLOCK_SIZE), b""):
+                    hasher.update(chunk)
+            return hasher.hexdigest()
         except Exception as e:
             logger.warning(f"Could not calculate checksum for {file_path}: {e}")
             return ""
     
     def _sync_directory_from_remote(self, sftp: SFTPClient, remote_dir: str, 
-                                   local_dir: Path, node_name: str) -> Dict[str, str]:
+                                   local_dir: Path, node_name: str,
+                                   remote_tree: Optional[List[Tuple[str, str, int, str]]] = None) -> Dict[str, str]:
         """
         Recursively sync a directory from remote to local
         
@@ -250,12 +565,38 @@ class ClusterManager:
             remote_dir: Remote directory path
             local_dir: Local directory path
             node_name: Node name for logging
+            remote_tree: Optional listing from _remote_tree; when given, files are
+                        downloaded from it instead of walking with listdir_attr
             
         Returns:
             Dict mapping local file paths to their checksums
         """
         checksums = {}
         
+        # Downloads stay on this thread; writer threads hash and write the bytes
+        # so disk and CPU work overlaps the next file's network round trips
+        write_queue: queue.Queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        
+        def _write_worker():
+            while True:
+                item = write_queue.get()
+                if item is None:
+                    return
+                relative_path, local_item_path, data = item
+                try:
+                    hasher = _new_hasher()
+                    hasher.update(data)
+                    with open(local_item_path, 'wb') as f:
+                        f.write(data)
+                    checksums[relative_path] = hasher.hexdigest()
+                except Exception as e:
+                    self.cluster_logger.error(f"Error writing {local_item_path}: {e}")
+                    
+        def _download(remote_item_path: str, local_item_path: Path):
+            data = self._sftp_read(sftp, remote_item_path)
+            write_queue.put((str(local_item_path.relative_to(local_dir)), local_item_path, data))
+            self.cluster_logger.debug(f"Downloaded {remote_item_path} to {local_item_path}")
+        
         def _sync_recursive(remote_path: str, local_path: Path):
             try:
                 # List remote directory contents
@@ -271,13 +612,7 @@ class ClusterManager:
                         # Recursively sync subdirectory
                         _sync_recursive(remote_item_path, local_item_path)
                     else:  # File
-                        # Download file
-                        sftp.get(remote_item_path, str(local_item_path))
-                        # Calculate checksum
-                        checksum = self._calculate_checksum(local_item_path)
-                        checksums[str(local_item_path.relative_to(local_dir))] = checksum
-                        
-                        self.cluster_logger.debug(f"Downloaded {remote_item_path} to {local_item_path}")
+                        _download(remote_item_path, local_item_path)
                         
             except Exception as e:
                 self.cluster_logger.error(f"Error syncing {remote_path}: {e}")
@@ -285,9 +620,368 @@ class ClusterManager:
         # Ensure local directory exists
         local_dir.mkdir(parents=True, exist_ok=True)
         
-        # Start recursive sync
-        _sync_recursive(remote_dir.rstrip('/'), local_dir)
+        workers = [threading.Thread(target=_write_worker, daemon=True)
+                   for _ in range(max(2, (os.cpu_count() or 2) // 2))]
+        for worker in workers:
+            worker.start()
+            
+        try:
+            if remote_tree is not None:
+                remote_root = remote_dir.rstrip('/')
+                for entry_type, relative_path, _, _ in remote_tree:
+                    local_item_path = local_dir / relative_path
+                    if entry_type == 'd':
+                        local_item_path.mkdir(parents=True, exist_ok=True)
+                    elif entry_type in ('f', 'l'):
+                        remote_item_path = f"{remote_root}/{relative_path}"
+                        try:
+                            local_item_path.parent.mkdir(parents=True, exist_ok=True)
+                            _download(remote_item_path, local_item_path)
+                        except Exception as e:
+                            self.cluster_logger.error(f"Error syncing {remote_item_path}: {e}")
+            else:
+                # Start recursive sync
+                _sync_recursive(remote_dir.rstrip('/'), local_dir)
+        finally:
+            for _ in workers:
+                write_queue.put(None)
+            for worker in workers:
+                worker.join()
+        
+        return checksums
+    
+    def _remote_has_tar(self, ssh: SSHClient) -> bool:
+        """Check whether the remote node has a usable tar binary"""
+        try:
+            _, stdout, _ = ssh.exec_command("command -v tar")
+            return stdout.channel.recv_exit_status() == 0
+        except Exception as e:
+            self.cluster_logger.debug(f"Could not probe remote tar: {e}")
+            return False
+
+    def _sync_directory_from_remote_tar(self, ssh: SSHClient, remote_dir: str,
+                                        local_dir: Path, node_name: str) -> Dict[str, str]:
+        """
+        Sync a directory from remote to local as a single tar stream over SSH
+
+        One exec_command replaces the per-file listdir/get round trips of
+        _sync_directory_from_remote, which matters on high-latency links.
+
+        Args:
+            ssh: SSH client
+            remote_dir: Remote directory path
+            local_dir: Local directory path
+            node_name: Node name for logging
+
+        Returns:
+            Dict mapping local file paths to their checksums
+
+        Raises:
+            ConfigSyncError: If the remote tar command fails
+        """
+        local_dir.mkdir(parents=True, exist_ok=True)
+
+        # With SSH transport compression on, gzipping the tar as well only burns CPU
+        if self.cluster_settings.get('compress', True):
+            tar_flags, stream_mode = "cf", "r|"
+        else:
+            tar_flags, stream_mode = "czf", "r|gz"
+        stdin, stdout, stderr = ssh.exec_command(f"tar {tar_flags} - -C {shlex.quote(remote_dir.rstrip('/'))} .")
+        stdin.close()
+
+        # The 'data' filter rejects absolute paths and links escaping local_dir
+        data_filter = getattr(tarfile, 'data_filter', None)
+        extract_kwargs = {'filter': 'data'} if data_filter else {}
+        checksums = {}
+        with tarfile.open(fileobj=stdout, mode=stream_mode) as tf:
+            for member in tf:
+                if data_filter:
+                    member = data_filter(member, str(local_dir))
+                elif os.path.isabs(member.name) or '..' in Path(member.name).parts:
+                    raise ConfigSyncError(f"Unsafe path in tar stream from {node_name}: {member.name}")
+
+                target = local_dir / os.path.normpath(member.name)
+                if member.isdir():
+                    target.mkdir(parents=True, exist_ok=True)
+                elif member.isfile():
+                    # Hash regular files while writing them instead of re-reading them afterwards
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    with tf.extractfile(member) as src, open(target, 'wb') as dst:
+                        checksums[str(target.relative_to(local_dir))] = _copy_and_hash(src, dst)
+                    os.utime(target, (member.mtime, member.mtime))
+                else:
+                    tf.extract(member, local_dir, **extract_kwargs)
+                    if target.is_file():
+                        checksums[str(target.relative_to(local_dir))] = self._calculate_checksum(target)
+
+        # GNU tar exits with 1 when a file changed while being read; the archive is still usable
+        exit_status = stdout.channel.recv_exit_status()
+        if exit_status > 1:
+            error_output = stderr.read().decode('utf-8', errors='replace').strip()
+            raise ConfigSyncError(f"Remote tar failed on {node_name} (exit {exit_status}): {error_output}")
+
+        self.cluster_logger.debug(f"Extracted {len(checksums)} files from {node_name} via tar stream")
+        return checksums
+
+    def _push_files_via_tar(self, ssh: SSHClient, remote_dir: str,
+                            files: Dict[str, Tuple[bytes, int]], node_name: str):
+        """
+        Write several files into a remote directory with a single tar stream over SSH
+
+        Args:
+            ssh: SSH client
+            remote_dir: Remote directory the relative paths are rooted at
+            files: Dict mapping relative file paths to (new contents, permission bits)
+            node_name: Node name for logging
+
+        Raises:
+            ConfigSyncError: If the remote tar command fails
+        """
+        # --overwrite writes existing files in place, keeping their inode, owner and links
+        stdin, stdout, stderr = ssh.exec_command(
+            f"tar --overwrite -xf - -C {shlex.quote(remote_dir.rstrip('/'))}"
+        )
+        mtime = time.time()
+        with tarfile.open(fileobj=stdin, mode="w|") as tf:
+            for relative_path, (data, mode) in files.items():
+                info = tarfile.TarInfo(relative_path)
+                info.size = len(data)
+                info.mode = mode
+                info.mtime = mtime
+                tf.addfile(info, io.BytesIO(data))
+        stdin.close()
+
+        exit_status = stdout.channel.recv_exit_status()
+        if exit_status != 0:
+            error_output = stderr.read().decode('utf-8', errors='replace').strip()
+            raise ConfigSyncError(f"Remote tar extract failed on {node_name} (exit {exit_status}): {error_output}")
+
+        self.cluster_logger.debug(f"Pushed {len(files)} files to {node_name} via tar stream")
+
+    def _remote_tree(self, ssh: SSHClient, remote_dir: str) -> Optional[List[Tuple[str, str, int, str]]]:
+        """
+        List everything under a remote directory in one round trip
+        
+        Args:
+            ssh: SSH client
+            remote_dir: Remote directory path
+            
+        Returns:
+            List of (type, relative path, size, mtime) tuples where type is the
+            find %y letter ('f' file, 'd' directory, 'l' symlink, ...), or None
+            if the remote find does not support -printf
+        """
+        try:
+            stdin, stdout, stderr = ssh.exec_command(
+                f"find {shlex.quote(remote_dir.rstrip('/'))} -mindepth 1 -printf '%y\\t%P\\t%s\\t%T@\\n'"
+            )
+            stdin.close()
+            output = stdout.read().decode('utf-8', errors='surrogateescape')
+            if stdout.channel.recv_exit_status() != 0:
+                return None
+        except Exception as e:
+            self.cluster_logger.debug(f"Could not list remote tree for {remote_dir}: {e}")
+            return None
+            
+        tree = []
+        for line in output.splitlines():
+            entry_type, _, rest = line.partition('\t')
+            parts = rest.rsplit('\t', 2)
+            if len(parts) != 3:
+                return None
+            relative_path, size, mtime = parts
+            tree.append((entry_type, relative_path, int(size), mtime))
+        return tree
+    
+    def _remote_sha256(self, ssh: SSHClient, remote_dir: str, relative_paths: List[str]) -> Dict[str, str]:
+        """
+        Hash many remote files with a single sha256sum run
         
+        Args:
+            ssh: SSH client
+            remote_dir: Remote directory the paths are relative to
+            relative_paths: Paths to hash, relative to remote_dir
+            
+        Returns:
+            Mapping of relative path to SHA-256 hex digest; paths that are
+            missing or could not be hashed are left out
+        """
+        checksums = {}
+        try:
+            # Paths go over stdin so the command line stays short however many files there are
+            stdin, stdout, stderr = ssh.exec_command(
+                f"cd {shlex.quote(remote_dir.rstrip('/'))} && xargs -0 sha256sum --"
+            )
+            stdin.write('\0'.join(relative_paths).encode('utf-8', errors='surrogateescape'))
+            stdin.close()
+            output = stdout.read().decode('utf-8', errors='surrogateescape')
+            # Missing files make sha256sum exit non-zero; the rest of its output is still good
+            stdout.channel.recv_exit_status()
+        except Exception as e:
+            self.cluster_logger.debug(f"Could not hash remote files under {remote_dir}: {e}")
+            return checksums
+        
+        for line in output.splitlines():
+            # sha256sum escapes unusual names with a leading backslash; those just get pushed
+            if line.startswith('\\'):
+                continue
+            digest, sep, relative_path = line.partition('  ')
+            if sep and len(digest) == 64:
+                checksums[relative_path] = digest
+        return checksums
+    
+    def _load_snapshot_manifest(self, node_snapshot_dir: Path) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Load the manifest.json written by the previous sync, if it is usable"""
+        manifest_file = node_snapshot_dir / "manifest.json"
+        try:
+            with open(manifest_file, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get('algorithm') != CHECKSUM_ALGORITHM:
+            return None
+        return data.get('files')
+    
+    def _save_snapshot_manifest(self, node_snapshot_dir: Path,
+                                remote_manifest: Dict[str, Tuple[int, str]],
+                                checksums: Dict[str, str]):
+        """
+        Atomically write manifest.json recording size, mtime and checksum per file
+        
+        The local file's stat is stored too, so snapshot files edited locally
+        are re-fetched rather than trusted on the next incremental sync.
+        """
+        conf_snapshot_dir = node_snapshot_dir / "conf.d"
+        files = {}
+        for path, (size, mtime) in remote_manifest.items():
+            if path not in checksums:
+                continue
+            try:
+                st = (conf_snapshot_dir / path).stat()
+            except OSError:
+                continue
+            files[path] = {
+                'size': size,
+                'mtime': mtime,
+                'checksum': checksums[path],
+                'local_mtime_ns': st.st_mtime_ns,
+                'local_size': st.st_size
+            }
+        manifest_file = node_snapshot_dir / "manifest.json"
+        temp_file = manifest_file.with_suffix('.json.tmp')
+        with open(temp_file, 'w') as f:
+            json.dump({'algorithm': CHECKSUM_ALGORITHM, 'files': files}, f)
+        os.replace(temp_file, manifest_file)
+    
+    def _sync_changed_files(self, sftp: SFTPClient, remote_dir: str, local_dir: Path,
+                            node_name: str, remote_manifest: Dict[str, Tuple[int, str]],
+                            previous: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Bring a local snapshot up to date by downloading only files whose size or mtime changed
+        
+        Args:
+            sftp: SFTP client
+            remote_dir: Remote directory path
+            local_dir: Local snapshot directory
+            node_name: Node name for logging
+            remote_manifest: Current remote (size, mtime) per relative path
+            previous: Manifest entries recorded by the previous sync
+            
+        Returns:
+            Dict mapping local file paths to their checksums
+        """
+        remote_dir = remote_dir.rstrip('/')
+        checksums = {}
+        downloaded = 0
+        
+        for relative_path, (size, mtime) in remote_manifest.items():
+            local_path = local_dir / relative_path
+            entry = previous.get(relative_path)
+            if entry and entry.get('size') == size and entry.get('mtime') == mtime:
+                try:
+                    st = local_path.stat()
+                    unchanged = (st.st_mtime_ns == entry.get('local_mtime_ns')
+                                 and st.st_size == entry.get('local_size'))
+                except OSError:
+                    unchanged = False
+                if unchanged:
+                    checksums[relative_path] = entry['checksum']
+                    continue
+                
+            local_path.parent.mkdir(parents=True, exist_ok=True)
+            checksums[relative_path] = self._sftp_download(
+                sftp, f"{remote_dir}/{relative_path}", local_path
+            )
+            downloaded += 1
+            
+        # Drop files that no longer exist on the remote
+        removed = 0
+        for relative_path in previous.keys() - remote_manifest.keys():
+            try:
+                (local_dir / relative_path).unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+                
+        self.cluster_logger.info(
+            f"Incremental sync from {node_name}: {downloaded} downloaded, "
+            f"{removed} removed, {len(checksums) - downloaded} unchanged"
+        )
+        return checksums
+    
+    def _sync_changed_content(self, ssh: SSHClient, sftp: SFTPClient, remote_dir: str, local_dir: Path,
+                              node_name: str, remote_manifest: Dict[str, Tuple[int, str]]) -> Optional[Dict[str, str]]:
+        """
+        Bring a local snapshot up to date by comparing file contents with the remote
+        
+        Used when there is a local snapshot but no manifest to compare
+        size/mtime against: every remote file is hashed with one sha256sum run
+        and only files whose content differs are downloaded.
+        
+        Args:
+            ssh: SSH client
+            sftp: SFTP client
+            remote_dir: Remote directory path
+            local_dir: Local snapshot directory
+            node_name: Node name for logging
+            remote_manifest: Current remote (size, mtime) per relative path
+            
+        Returns:
+            Dict mapping local file paths to their checksums, or None if the
+            remote files could not be hashed
+        """
+        remote_dir = remote_dir.rstrip('/')
+        remote_checksums = self._remote_sha256(ssh, remote_dir, list(remote_manifest))
+        if remote_manifest and not remote_checksums:
+            return None
+            
+        checksums = {}
+        downloaded = 0
+        for relative_path in remote_manifest:
+            local_path = local_dir / relative_path
+            remote_checksum = remote_checksums.get(relative_path)
+            if remote_checksum is not None and local_path.is_file() and _sha256_file(local_path) == remote_checksum:
+                checksums[relative_path] = (remote_checksum if CHECKSUM_ALGORITHM == 'sha256'
+                                            else self._calculate_checksum(local_path))
+                continue
+                
+            local_path.parent.mkdir(parents=True, exist_ok=True)
+            checksums[relative_path] = self._sftp_download(
+                sftp, f"{remote_dir}/{relative_path}", local_path
+            )
+            downloaded += 1
+            
+        # Drop files that no longer exist on the remote ("" matches every file name)
+        removed = 0
+        for local_path in _find_files(local_dir, ("",)):
+            if local_path.relative_to(local_dir).as_posix() not in remote_manifest:
+                local_path.unlink()
+                removed += 1
+                
+        self.cluster_logger.info(
+            f"Content sync from {node_name}: {downloaded} downloaded, "
+            f"{removed} removed, {len(checksums) - downloaded} unchanged"
+        )
         return checksums
     
     def get_all_submodule_configs(self, node_name: str = None) -> Dict[str, Dict[str, Any]]:
@@ -306,41 +1000,54 @@ class ClusterManager:
         try:
             if node_name:
                 # Use specific node's snapshot
-                snapshot_dir = self.conf_snapshots_dir / node_name / "conf.d"
+                _, snapshot_dir = self._snapshot_dirs(node_name)
             else:
-                # If no node specified, try to use the first available node snapshot
-                available_nodes = [d.name for d in self.conf_snapshots_dir.iterdir() 
-                                 if d.is_dir() and (d / "conf.d").exists()]
-                if not available_nodes:
+                # If no node specified, use the first available node snapshot
+                node_name = self._get_default_snapshot_node()
+                if not node_name:
                     logger.warning("No node snapshots available")
                     return {}
                 
-                # Use the first available node snapshot
-                node_name = available_nodes[0]
-                snapshot_dir = self.conf_snapshots_dir / node_name / "conf.d"
+                _, snapshot_dir = self._snapshot_dirs(node_name)
                 logger.info(f"Using snapshot from node {node_name} (first available)")
                 
             if not snapshot_dir.exists():
                 logger.warning(f"Configuration directory {snapshot_dir} not found")
                 return {}
                 
-            # Walk through all module directories
-            for module_dir in snapshot_dir.iterdir():
-                if not module_dir.is_dir() or module_dir.name.startswith('.'):
-                    continue
-                    
-                # Skip the main conf.yml
-                if module_dir.name == 'conf.yml':
-                    continue
-                    
-                module_conf_path = module_dir / "conf.yml"
-                if not module_conf_path.exists():
-                    continue
-                    
-                # Load module config to get submodules list
+            # Reuse the previous result while nothing in the snapshot has changed
+            signature = self._snapshot_signature(snapshot_dir)
+            cached = self._submodule_cache.get(node_name)
+            if cached is not None and cached[0] == signature:
+                return dict(cached[1])
+                
+            # Seed the per-file cache from disk so a cold start can skip YAML parsing
+            if node_name not in self._parsed_cache_loaded:
+                self._parsed_cache_loaded.add(node_name)
+                self._load_parsed_cache(node_name, snapshot_dir)
+            parse_count = self._yaml_parse_count
+            module_conf_paths = []
+            process_submodule = self._process_submodule_file
+                
+            # Walk through all module directories; DirEntry carries the type without an extra stat
+            with os.scandir(snapshot_dir) as module_entries:
+                module_entries = [entry for entry in module_entries
+                                  if entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.')]
+                
+            for module_entry in module_entries:
                 try:
-                    with open(module_conf_path, 'r') as f:
-                        module_config = yaml.safe_load(f) or {}
+                    # One listing per module serves conf.yml lookup, wildcard and named includes
+                    with os.scandir(module_entry.path) as file_entries:
+                        yml_files = {entry.name: entry.path for entry in file_entries
+                                     if entry.name.endswith('.yml') and entry.is_file()}
+                        
+                    if 'conf.yml' not in yml_files:
+                        continue
+                        
+                    # Load module config to get submodules list
+                    module_config, _ = self._load_yaml_cached(Path(yml_files['conf.yml']))
+                    module_conf_paths.append(yml_files['conf.yml'])
+                    module_config = module_config or {}
                         
                     # Get included submodules
                     included_submodules = module_config.get('Include_sub_modules', [])
@@ -351,37 +1058,142 @@ class ClusterManager:
                     for submodule_name in included_submodules:
                         if submodule_name == '*':
                             # Handle wildcard - include all .yml files
-                            for yml_file in module_dir.glob("*.yml"):
-                                if yml_file.name != "conf.yml":
-                                    self._process_submodule_file(
-                                        yml_file, module_dir.name, 
-                                        yml_file.stem, submodule_configs
+                            for file_name, file_path in yml_files.items():
+                                if file_name != "conf.yml":
+                                    process_submodule(
+                                        Path(file_path), module_entry.name, 
+                                        file_name[:-len('.yml')], submodule_configs
                                     )
                         else:
                             # Handle specific submodule
-                            submodule_path = module_dir / f"{submodule_name}.yml"
-                            if submodule_path.exists():
-                                self._process_submodule_file(
-                                    submodule_path, module_dir.name, 
+                            file_path = yml_files.get(f"{submodule_name}.yml")
+                            if file_path is not None:
+                                process_submodule(
+                                    Path(file_path), module_entry.name, 
                                     submodule_name, submodule_configs
                                 )
                                 
                 except Exception as e:
-                    logger.error(f"Error processing module {module_dir.name}: {e}")
+                    logger.error(f"Error processing module {module_entry.name}: {e}")
                     continue
                     
+            self._submodule_cache[node_name] = (signature, submodule_configs)
+            if self._yaml_parse_count != parse_count:
+                self._save_parsed_cache(
+                    node_name, snapshot_dir,
+                    module_conf_paths + [info['file_path'] for info in submodule_configs.values()]
+                )
+            submodule_configs = dict(submodule_configs)
+            
         except Exception as e:
             logger.error(f"Error getting submodule configs: {e}")
             
         return submodule_configs
     
+    def _snapshot_signature(self, snapshot_dir: Path) -> Tuple[int, int]:
+        """
+        Cheap change signature for a snapshot: (sum of mtime_ns, entry count)
+        
+        Covers edits, additions and removals of module directories and their
+        files without reading any file contents.
+        """
+        total = snapshot_dir.stat().st_mtime_ns
+        count = 0
+        with os.scandir(snapshot_dir) as module_entries:
+            for module_entry in module_entries:
+                count += 1
+                total += module_entry.stat(follow_symlinks=False).st_mtime_ns
+                if not module_entry.is_dir(follow_symlinks=False):
+                    continue
+                with os.scandir(module_entry.path) as file_entries:
+                    for file_entry in file_entries:
+                        count += 1
+                        total += file_entry.stat().st_mtime_ns
+        return total, count
+    
+    def _load_yaml_cached(self, file_path: Path) -> Tuple[Any, str]:
+        """
+        Load a YAML file, reusing the previous parse if the file is unchanged
+        
+        Entries are validated against (st_mtime_ns, st_size); the returned
+        data is shared between callers and must not be mutated.
+        
+        Returns:
+            Tuple of (parsed data, raw content)
+        """
+        st = file_path.stat()
+        key = str(file_path)
+        cached = self._yaml_cache.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2], cached[3]
+            
+        with open(file_path, 'r') as f:
+            content = f.read()
+        config_data = yaml.load(content, Loader=SafeLoader)
+        self._yaml_cache[key] = (st.st_mtime_ns, st.st_size, config_data, content)
+        self._yaml_parse_count += 1
+        return config_data, content
+    
+    def _load_parsed_cache(self, node_name: str, snapshot_dir: Path):
+        """
+        Seed the per-file YAML cache from the node's persisted parsed cache
+        
+        Entries are still validated against each file's (mtime_ns, size) in
+        _load_yaml_cached, so a changed file only invalidates its own entry.
+        """
+        cache_file = self._snapshot_dirs(node_name)[0] / PARSED_CACHE_FILE
+        try:
+            with open(cache_file, 'rb') as f:
+                header = json.loads(f.readline())
+                body = f.read()
+            if (header.get('version') != PARSED_CACHE_VERSION or
+                    header.get('digest') != hashlib.sha256(body).hexdigest()):
+                logger.warning(f"Ignoring stale or corrupt parsed cache {cache_file}")
+                return
+            entries = json.loads(body)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read parsed cache {cache_file}: {e}")
+            return
+            
+        for relative_path, (mtime_ns, size, config_data, content) in entries.items():
+            key = str(snapshot_dir / relative_path)
+            if key not in self._yaml_cache:
+                self._yaml_cache[key] = (mtime_ns, size, config_data, content)
+        logger.debug(f"Loaded {len(entries)} parsed YAML entries for node {node_name}")
+    
+    def _save_parsed_cache(self, node_name: str, snapshot_dir: Path, file_paths: List[str]):
+        """Persist the parsed YAML for a snapshot's files next to the snapshot"""
+        entries = {}
+        for file_path in file_paths:
+            cached = self._yaml_cache.get(file_path)
+            # JSON would silently turn non-string keys, dates etc. into something else
+            if cached is None or not _is_json_native(cached[2]):
+                continue
+            entries[os.path.relpath(file_path, snapshot_dir)] = list(cached)
+            
+        body = json.dumps(entries, separators=(',', ':')).encode('utf-8')
+        header = json.dumps({
+            'version': PARSED_CACHE_VERSION,
+            'digest': hashlib.sha256(body).hexdigest()
+        }).encode('utf-8')
+        
+        cache_file = self._snapshot_dirs(node_name)[0] / PARSED_CACHE_FILE
+        temp_file = cache_file.with_suffix('.json.tmp')
+        try:
+            with open(temp_file, 'wb') as f:
+                f.write(header + b'\n' + body)
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            logger.warning(f"Could not write parsed cache {cache_file}: {e}")
+    
     def _process_submodule_file(self, file_path: Path, module_name: str, 
                                submodule_name: str, configs_dict: Dict):
         """Process a single submodule file and extract config info"""
         try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-                config_data = yaml.safe_load(content) or {}
+            config_data, content = self._load_yaml_cached(file_path)
+            config_data = config_data or {}
                 
             # Create unique key for this submodule
             submodule_key = f"{module_name}/{submodule_name}"
@@ -400,10 +1212,8 @@ class ClusterManager:
     
     def _has_unique_key_config(self, config_data: Dict) -> bool:
         """Check if config data has unique key configuration"""
-        return (isinstance(config_data, dict) and 
-                'uniquekey' in config_data and 
-                isinstance(config_data['uniquekey'], dict) and
-                'NumUniqKey' in config_data['uniquekey'])
+        unique_key = config_data.get('uniquekey') if isinstance(config_data, dict) else None
+        return isinstance(unique_key, dict) and 'NumUniqKey' in unique_key
     
     def bulk_edit_submodule_unique_keys(self, node_name: str, 
                                        unique_key_updates: Dict[str, int],
@@ -422,11 +1232,11 @@ class ClusterManager:
         """
         results = {}
         
-        if node_name not in self.nodes_config.get('nodes', {}):
+        if node_name not in self._nodes:
             logger.error(f"Node {node_name} not found in configuration")
             return {path: False for path in unique_key_updates.keys()}
             
-        node_config = self.nodes_config['nodes'][node_name]
+        node_config = self._nodes[node_name]
         
         if not node_config.get('enabled', True):
             logger.error(f"Node {node_name} is disabled")
@@ -439,69 +1249,96 @@ class ClusterManager:
                 if not backup_success:
                     logger.warning(f"Failed to create backup for node {node_name}")
                     
-            # Establish connection
-            ssh, sftp = self._create_ssh_connection(node_config)
-            
-            try:
-                # Process each submodule update
+            # Check out a pooled connection
+            with self._acquire(node_config) as (ssh, sftp):
+                # Edited file bodies keyed by submodule path: (path relative to conf_dir, content)
+                pending: Dict[str, Tuple[str, bytes, int]] = {}
+                
+                # Download and edit submodules concurrently, one SFTP channel per worker
+                edits = {}
                 for submodule_path, new_value in unique_key_updates.items():
+                    if '/' not in submodule_path:
+                        logger.error(f"Invalid submodule path format: {submodule_path}")
+                        results[submodule_path] = False
+                        continue
+                    edits[submodule_path] = new_value
+                    
+                if edits:
+                    # SFTPClient is not safe to share between threads, so each worker
+                    # checks a channel out of the queue for the duration of its edit
+                    channel_count = min(MAX_SUBMODULE_WORKERS, len(edits))
+                    channels: queue.Queue = queue.Queue()
+                    channels.put(sftp)
+                    extra_channels = []
                     try:
-                        module_name, submodule_name = submodule_path.split('/', 1)
-                        remote_file_path = f"{node_config['conf_dir']}/{module_name}/{submodule_name}.yml"
-                        
-                        # Download current file
-                        with tempfile.NamedTemporaryFile(mode='w+', suffix='.yml', delete=False) as temp_file:
-                            temp_path = temp_file.name
-                            
+                        transport = ssh.get_transport()
+                        for _ in range(channel_count - 1):
+                            extra_channels.append(paramiko.SFTPClient.from_transport(transport))
+                            channels.put(extra_channels[-1])
+                    except Exception as e:
+                        self.cluster_logger.debug(f"Using {channels.qsize()} SFTP channel(s) for {node_name}: {e}")
+                    
+                    def edit_one(submodule_path: str, new_value: int) -> Tuple[str, bytes]:
+                        channel = channels.get()
                         try:
-                            sftp.get(remote_file_path, temp_path)
-                            
-                            # Load and modify the YAML
-                            with open(temp_path, 'r') as f:
-                                content = f.read()
-                                config_data = yaml.safe_load(content) or {}
-                                
-                            # Update the NumUniqKey value
-                            if 'uniquekey' not in config_data:
-                                config_data['uniquekey'] = {}
-                            if not isinstance(config_data['uniquekey'], dict):
-                                config_data['uniquekey'] = {}
-                                
-                            config_data['uniquekey']['NumUniqKey'] = new_value
-                            
-                            # Write back to temp file with preserved formatting
-                            with open(temp_path, 'w') as f:
-                                yaml.dump(config_data, f, default_flow_style=False, 
-                                        allow_unicode=True, sort_keys=False)
-                                
-                            # Upload modified file back
-                            sftp.put(temp_path, remote_file_path)
-                            
-                            results[submodule_path] = True
-                            self.cluster_logger.info(
-                                f"Updated {submodule_path} on {node_name}: NumUniqKey = {new_value}"
-                            )
-                            
+                            return self._edit_one_submodule(channel, node_config, submodule_path, new_value)
+                        finally:
+                            channels.put(channel)
+                    
+                    try:
+                        with ThreadPoolExecutor(max_workers=channels.qsize()) as pool:
+                            futures = {
+                                pool.submit(edit_one, submodule_path, new_value): submodule_path
+                                for submodule_path, new_value in edits.items()
+                            }
+                            for future in as_completed(futures):
+                                submodule_path = futures[future]
+                                try:
+                                    pending[submodule_path] = future.result()
+                                except Exception as e:
+                                    error_msg = f"Error updating {submodule_path} on {node_name}: {e}"
+                                    logger.error(error_msg)
+                                    self.cluster_logger.error(error_msg)
+                                    results[submodule_path] = False
+                    finally:
+                        for channel in extra_channels:
+                            try:
+                                channel.close()
+                            except Exception:
+                                pass
+                
+                # Upload every edited file in one tar stream, falling back to per-file SFTP
+                pushed = False
+                if pending and self._remote_has_tar(ssh):
+                    try:
+                        self._push_files_via_tar(
+                            ssh, node_config['conf_dir'],
+                            {relative_path: (data, mode) for relative_path, data, mode in pending.values()},
+                            node_name
+                        )
+                        pushed = True
+                    except Exception as e:
+                        self.cluster_logger.warning(
+                            f"Tar upload to {node_name} failed, falling back to SFTP: {e}"
+                        )
+                
+                for submodule_path, (relative_path, data, _mode) in pending.items():
+                    if not pushed:
+                        try:
+                            remote_file_path = f"{node_config['conf_dir']}/{relative_path}"
+                            sftp.putfo(io.BytesIO(data), remote_file_path, file_size=len(data))
                         except Exception as e:
                             error_msg = f"Error updating {submodule_path} on {node_name}: {e}"
                             logger.error(error_msg)
                             self.cluster_logger.error(error_msg)
                             results[submodule_path] = False
-                            
-                        finally:
-                            # Clean up temp file
-                            try:
-                                os.unlink(temp_path)
-                            except:
-                                pass
-                                
-                    except ValueError:
-                        logger.error(f"Invalid submodule path format: {submodule_path}")
-                        results[submodule_path] = False
-                        
-            finally:
-                sftp.close()
-                ssh.close()
+                            continue
+                    
+                    results[submodule_path] = True
+                    self.cluster_logger.info(
+                        f"Updated {submodule_path} on {node_name}: "
+                        f"NumUniqKey = {unique_key_updates[submodule_path]}"
+                    )
                 
         except NodeConnectionError as e:
             error_msg = f"Connection error for node {node_name}: {e}"
@@ -516,6 +1353,90 @@ class ClusterManager:
             
         return results
     
+    def _edit_one_submodule(self, sftp: SFTPClient, node_config: Dict[str, Any],
+                            submodule_path: str, new_value: int) -> Tuple[str, bytes, int]:
+        """
+        Download one submodule file and return it with NumUniqKey set to new_value
+        
+        Args:
+            sftp: SFTP client, used by this call only
+            node_config: Node configuration dictionary
+            submodule_path: Submodule path in "module/submodule" form
+            new_value: New NumUniqKey value
+            
+        Returns:
+            Tuple of (path relative to conf_dir, new file content, current permission bits)
+        """
+        module_name, submodule_name = submodule_path.split('/', 1)
+        relative_path = f"{module_name}/{submodule_name}.yml"
+        remote_file_path = f"{node_config['conf_dir']}/{relative_path}"
+        
+        # Read the current file straight into memory, keeping its mode for the upload
+        mode = stat.S_IMODE(sftp.stat(remote_file_path).st_mode)
+        content = self._sftp_read(sftp, remote_file_path)
+            
+        # Common case: swap the integer in place without a YAML round trip
+        patched = _patch_num_uniq_key(content, new_value)
+        if patched is not None:
+            return relative_path, patched, mode
+            
+        # Round-trip edit keeps comments, key order and quoting in the rest of the file
+        if RUAMEL_AVAILABLE:
+            round_trip = _round_trip_yaml()
+            config_data = round_trip.load(content)
+            if isinstance(config_data, dict):
+                if not isinstance(config_data.get('uniquekey'), dict):
+                    config_data['uniquekey'] = {}
+                config_data['uniquekey']['NumUniqKey'] = new_value
+                
+                buffer = io.BytesIO()
+                round_trip.dump(config_data, buffer)
+                return relative_path, buffer.getvalue(), mode
+                
+        # Load and modify the YAML
+        config_data = yaml.load(content.decode('utf-8'), Loader=SafeLoader) or {}
+        
+        # Update the NumUniqKey value
+        if 'uniquekey' not in config_data:
+            config_data['uniquekey'] = {}
+        if not isinstance(config_data['uniquekey'], dict):
+            config_data['uniquekey'] = {}
+            
+        config_data['uniquekey']['NumUniqKey'] = new_value
+        
+        # Serialize with preserved key order
+        return relative_path, yaml.dump(
+            config_data, Dumper=SafeDumper, default_flow_style=False,
+            allow_unicode=True, sort_keys=False
+        ).encode('utf-8'), mode
+    
+    def _run_per_node(self, node_names: List[str], func):
+        """
+        Run func(node_name) for each node on a thread pool
+        
+        Worker threads only read self._nodes and self.cluster_settings,
+        which are not mutated while a bulk operation is running.
+        
+        Args:
+            node_names: Nodes to process
+            func: Callable taking a node name
+            
+        Yields:
+            (node_name, result) tuples in completion order; result is None if func raised
+        """
+        if not node_names:
+            return
+        with ThreadPoolExecutor(max_workers=min(MAX_NODE_WORKERS, len(node_names))) as pool:
+            futures = {pool.submit(func, name): name for name in node_names}
+            for future in as_completed(futures):
+                node_name = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self.cluster_logger.error(f"Operation on node {node_name} failed: {e}")
+                    result = None
+                yield node_name, result
+    
     def bulk_edit_all_nodes_unique_keys(self, unique_key_updates: Dict[str, int],
                                        target_nodes: List[str] = None,
                                        create_backup: bool = True) -> Dict[str, Dict[str, bool]]:
@@ -535,21 +1456,28 @@ class ClusterManager:
         # Determine target nodes
         if target_nodes is None:
             target_nodes = [
-                name for name, config in self.nodes_config.get('nodes', {}).items()
+                name for name, config in self._nodes.items()
                 if config.get('enabled', True)
             ]
         
-        # Process each node
+        valid_nodes = []
         for node_name in target_nodes:
-            if node_name not in self.nodes_config.get('nodes', {}):
+            if node_name not in self._nodes:
                 logger.warning(f"Node {node_name} not found in configuration")
                 all_results[node_name] = {path: False for path in unique_key_updates.keys()}
                 continue
-                
+            valid_nodes.append(node_name)
+        
+        def edit_node(node_name: str) -> Dict[str, bool]:
             self.cluster_logger.info(f"Starting bulk edit on node {node_name}")
-            node_results = self.bulk_edit_submodule_unique_keys(
+            return self.bulk_edit_submodule_unique_keys(
                 node_name, unique_key_updates, create_backup
             )
+        
+        # Nodes are independent and the work is SSH-bound, so fan out across threads
+        for node_name, node_results in self._run_per_node(valid_nodes, edit_node):
+            if node_results is None:
+                node_results = {path: False for path in unique_key_updates.keys()}
             all_results[node_name] = node_results
             
             # Log summary for this node
@@ -559,7 +1487,7 @@ class ClusterManager:
                 f"Node {node_name}: {success_count}/{total_count} submodules updated successfully"
             )
             
-        return all_results
+        return {name: all_results[name] for name in target_nodes if name in all_results}
     
     def bulk_edit_module_unique_keys(self, node_name: str, module_name: str, 
                                     new_unique_key_value: int,
@@ -618,7 +1546,7 @@ class ClusterManager:
         # Determine target nodes
         if target_nodes is None:
             target_nodes = [
-                name for name, config in self.nodes_config.get('nodes', {}).items()
+                name for name, config in self._nodes.items()
                 if config.get('enabled', True)
             ]
         
@@ -627,17 +1555,24 @@ class ClusterManager:
             f"with NumUniqKey = {new_unique_key_value}"
         )
         
-        # Process each node
+        valid_nodes = []
         for node_name in target_nodes:
-            if node_name not in self.nodes_config.get('nodes', {}):
+            if node_name not in self._nodes:
                 logger.warning(f"Node {node_name} not found in configuration")
                 all_results[node_name] = {}
                 continue
-                
+            valid_nodes.append(node_name)
+        
+        def edit_node(node_name: str) -> Dict[str, bool]:
             self.cluster_logger.info(f"Processing module {module_name} on node {node_name}")
-            node_results = self.bulk_edit_module_unique_keys(
+            return self.bulk_edit_module_unique_keys(
                 node_name, module_name, new_unique_key_value, create_backup
             )
+        
+        # Nodes are independent and the work is SSH-bound, so fan out across threads
+        for node_name, node_results in self._run_per_node(valid_nodes, edit_node):
+            if node_results is None:
+                node_results = {}
             all_results[node_name] = node_results
             
             # Log summary for this node
@@ -648,7 +1583,7 @@ class ClusterManager:
                 f"submodules updated successfully"
             )
             
-        return all_results
+        return {name: all_results[name] for name in target_nodes if name in all_results}
     
     def get_module_submodules_summary(self, module_name: str, node_name: str = None) -> Dict[str, Any]:
         """
@@ -670,11 +1605,16 @@ class ClusterManager:
             'submodule_details': []
         }
         
+        # Local counters and a bound append keep dict/attribute lookups out of the loop
+        total_submodules = 0
+        with_unique_keys = 0
+        append_detail = module_summary['submodule_details'].append
+        
         for submodule_path, config_info in submodule_configs.items():
             if config_info['module_name'] != module_name:
                 continue
                 
-            module_summary['total_submodules'] += 1
+            total_submodules += 1
             
             # Extract current NumUniqKey value
             current_value = None
@@ -682,18 +1622,18 @@ class ClusterManager:
             
             if has_unique_key:
                 current_value = config_info['config_data']['uniquekey'].get('NumUniqKey')
-                module_summary['submodules_with_unique_keys'] += 1
+                with_unique_keys += 1
             
-            submodule_detail = {
+            append_detail({
                 'path': submodule_path,
                 'submodule_name': config_info['submodule_name'],
                 'has_unique_key_config': has_unique_key,
                 'current_num_uniq_key': current_value,
                 'file_path': config_info['file_path']
-            }
-            
-            module_summary['submodule_details'].append(submodule_detail)
+            })
             
+        module_summary['total_submodules'] = total_submodules
+        module_summary['submodules_with_unique_keys'] = with_unique_keys
         return module_summary
     
     def get_module_eps_calculation(self, module_names: List[str], node_name: str = None, 
@@ -710,14 +1650,65 @@ class ClusterManager:
         Returns:
             Dict with EPS calculations and details
         """
+        # Nothing to calculate, so don't fetch from the node
+        submodule_configs = self._refresh_submodule_configs(node_name) if module_names else {}
+        return self._calculate_module_eps(module_names, node_name, period, submodule_configs)
+    
+    def _refresh_submodule_configs(self, node_name: Optional[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch a node's config (if a node is given) and return its submodule configs"""
         if node_name:
             # Fetch fresh config from remote node
             fetch_success = self.fetch_node_config(node_name)
             if not fetch_success:
                 logger.warning(f"Failed to fetch config from node {node_name}, using cached data")
         
-        submodule_configs = self.get_all_submodule_configs(node_name)
+        return self.get_all_submodule_configs(node_name)
+    
+    def _compute_eps(self, module_names: List[str], node_name: Optional[str], period: int,
+                     submodule_configs: Dict[str, Dict[str, Any]]) -> Dict[str, Tuple[int, int, int, float]]:
+        """
+        Core EPS calculation shared by the detailed and quick summaries
         
+        Returns:
+            Dict mapping each module name to (module level unique key,
+            sum of submodule unique keys, submodule count, EPS)
+        """
+        # A non-positive period gives 0 EPS for every module; decide that once, not per module
+        if period <= 0:
+            self.cluster_logger.warning(f"EPS period must be positive, got {period}; reporting 0 EPS")
+        divisor = period if period > 0 else None
+        
+        # Sum and count submodule unique keys per module in one pass over the configs
+        sums_by_module: Dict[str, int] = {}
+        counts_by_module: Dict[str, int] = {}
+        for config_info in submodule_configs.values():
+            if config_info['has_unique_key_config']:
+                config_module = config_info['module_name']
+                sums_by_module[config_module] = (sums_by_module.get(config_module, 0)
+                                                 + config_info['config_data']['uniquekey'].get('NumUniqKey', 0))
+                counts_by_module[config_module] = counts_by_module.get(config_module, 0) + 1
+        
+        module_eps_values = {}
+        for module_name in module_names:
+            # Get module-level unique key from module conf.yml
+            module_level_unique_key = self._get_module_level_unique_key(module_name, node_name)
+            submodule_sum = sums_by_module.get(module_name, 0)
+            
+            # Calculate EPS for this module
+            module_eps = (module_level_unique_key * submodule_sum) / divisor if divisor else 0
+            module_eps_values[module_name] = (
+                module_level_unique_key, submodule_sum, counts_by_module.get(module_name, 0), module_eps
+            )
+            
+            self.cluster_logger.info(
+                f"Module {module_name} EPS: {module_eps} "
+                f"(Module key: {module_level_unique_key}, Submodule sum: {submodule_sum})"
+            )
+        return module_eps_values
+    
+    def _calculate_module_eps(self, module_names: List[str], node_name: Optional[str], period: int,
+                              submodule_configs: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """EPS calculation for get_module_eps_calculation over already-loaded submodule configs"""
         eps_results = {
             'node_name': node_name or 'Local Configuration',
             'period_seconds': period,
@@ -729,48 +1720,30 @@ class ClusterManager:
             }
         }
         
-        for module_name in module_names:
-            # Get module-level unique key from module conf.yml
-            module_level_unique_key = self._get_module_level_unique_key(module_name, node_name)
-            
-            # Get all submodules for this module
-            module_submodules = {
-                path: config for path, config in submodule_configs.items()
-                if config['module_name'] == module_name and config['has_unique_key_config']
-            }
-            
-            # Calculate sum of submodule unique keys
-            submodule_sum = 0
-            submodule_details = []
-            
-            for submodule_path, config_info in module_submodules.items():
-                submodule_unique_key = config_info['config_data']['uniquekey'].get('NumUniqKey', 0)
-                submodule_sum += submodule_unique_key
-                
-                submodule_details.append({
+        # Per-submodule details grouped by module in one pass over the configs
+        details_by_module: Dict[str, List[Dict[str, Any]]] = {}
+        for submodule_path, config_info in submodule_configs.items():
+            if config_info['has_unique_key_config']:
+                details_by_module.setdefault(config_info['module_name'], []).append({
                     'name': config_info['submodule_name'],
                     'path': submodule_path,
-                    'unique_key_value': submodule_unique_key
+                    'unique_key_value': config_info['config_data']['uniquekey'].get('NumUniqKey', 0)
                 })
-            
-            # Calculate EPS for this module
-            module_eps = (module_level_unique_key * submodule_sum) / period if period > 0 else 0
+        
+        module_eps_values = self._compute_eps(module_names, node_name, period, submodule_configs)
+        for module_name in module_names:
+            module_level_unique_key, submodule_sum, submodule_count, module_eps = module_eps_values[module_name]
             
             eps_results['modules'][module_name] = {
                 'module_level_unique_key': module_level_unique_key,
-                'submodule_count': len(module_submodules),
+                'submodule_count': submodule_count,
                 'submodule_unique_keys_sum': submodule_sum,
                 'calculated_eps': module_eps,
-                'submodule_details': submodule_details,
+                'submodule_details': details_by_module.get(module_name, []),
                 'calculation': f"({module_level_unique_key} * {submodule_sum}) / {period} = {module_eps}"
             }
             
             eps_results['total_eps'] += module_eps
-            
-            self.cluster_logger.info(
-                f"Module {module_name} EPS: {module_eps} "
-                f"(Module key: {module_level_unique_key}, Submodule sum: {submodule_sum})"
-            )
         
         eps_results['summary'] = {
             'total_modules_analyzed': len(module_names),
@@ -780,6 +1753,35 @@ class ClusterManager:
         
         return eps_results
     
+    def _invalidate_node_caches(self, node_name: str):
+        """Drop memoized lookups derived from a node's snapshot"""
+        self._module_key_cache = {
+            key: value for key, value in self._module_key_cache.items() if key[0] != node_name
+        }
+        self._submodule_cache.pop(node_name, None)
+        self._default_snapshot_node = None
+    
+    def _snapshot_dirs(self, node_name: str) -> Tuple[Path, Path]:
+        """Get a node's snapshot directory and its conf.d directory"""
+        dirs = self._snapshot_dir_cache.get(node_name)
+        if dirs is None:
+            node_snapshot_dir = self.conf_snapshots_dir / node_name
+            dirs = self._snapshot_dir_cache[node_name] = (node_snapshot_dir, node_snapshot_dir / "conf.d")
+        return dirs
+    
+    def _get_default_snapshot_node(self) -> Optional[str]:
+        """Name of the first node with a conf.d snapshot, remembered between calls"""
+        if self._default_snapshot_node is not None:
+            if self._snapshot_dirs(self._default_snapshot_node)[1].is_dir():
+                return self._default_snapshot_node
+            self._default_snapshot_node = None
+        
+        available_nodes = [d.name for d in self.conf_snapshots_dir.iterdir() 
+                         if d.is_dir() and (d / "conf.d").exists()]
+        if available_nodes:
+            self._default_snapshot_node = available_nodes[0]
+        return self._default_snapshot_node
+    
     def _get_module_level_unique_key(self, module_name: str, node_name: str = None) -> int:
         """
         Get the module-level unique key value from module's conf.yml
@@ -792,36 +1794,42 @@ class ClusterManager:
             Module level unique key value (defaults to 1 if not found)
         """
         try:
-            if node_name:
-                snapshot_dir = self.conf_snapshots_dir / node_name / "conf.d" / module_name
-            else:
+            if not node_name:
                 # Use first available node snapshot
-                available_nodes = [d.name for d in self.conf_snapshots_dir.iterdir() 
-                                 if d.is_dir() and (d / "conf.d").exists()]
-                if not available_nodes:
+                node_name = self._get_default_snapshot_node()
+                if not node_name:
                     logger.warning("No node snapshots available for module level unique key lookup")
                     return 1
                 
-                snapshot_dir = self.conf_snapshots_dir / available_nodes[0] / "conf.d" / module_name
+            module_conf_path = self._snapshot_dirs(node_name)[1] / module_name / "conf.yml"
             
-            module_conf_path = snapshot_dir / "conf.yml"
-            
-            if not module_conf_path.exists():
+            try:
+                st = module_conf_path.stat()
+            except FileNotFoundError:
                 logger.warning(f"Module config file not found: {module_conf_path}")
                 return 1
-            
-            with open(module_conf_path, 'r') as f:
-                module_config = yaml.safe_load(f) or {}
+                
+            # Memoized per (node, module); the stat guards against local edits between syncs
+            cache_key = (node_name, module_name)
+            signature = (st.st_mtime_ns, st.st_size)
+            cached = self._module_key_cache.get(cache_key)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
             
             # Look for unique key configuration in module conf.yml
-            if isinstance(module_config, dict) and 'uniquekey' in module_config:
-                if isinstance(module_config['uniquekey'], dict):
-                    module_unique_key = module_config['uniquekey'].get('NumUniqKey', 1)
-                    return module_unique_key
-            
-            # If no unique key found, default to 1
-            logger.info(f"No module-level unique key found for {module_name}, using default value 1")
-            return 1
+            module_unique_key = 1
+            unique_key = _read_unique_key_block(module_conf_path)
+            if unique_key is None:
+                module_config, _ = self._load_yaml_cached(module_conf_path)
+                unique_key = module_config.get('uniquekey') if isinstance(module_config, dict) else None
+            if isinstance(unique_key, dict):
+                module_unique_key = unique_key.get('NumUniqKey', 1)
+            else:
+                # If no unique key found, default to 1
+                logger.info(f"No module-level unique key found for {module_name}, using default value 1")
+                
+            self._module_key_cache[cache_key] = (signature, module_unique_key)
+            return module_unique_key
             
         except Exception as e:
             logger.warning(f"Error getting module level unique key for {module_name}: {e}")
@@ -838,21 +1846,16 @@ class ClusterManager:
         Returns:
             Dict with EPS summary for all modules
         """
-        if node_name:
-            # Fetch fresh config from remote node
-            fetch_success = self.fetch_node_config(node_name)
-            if not fetch_success:
-                logger.warning(f"Failed to fetch config from node {node_name}, using cached data")
-        
-        submodule_configs = self.get_all_submodule_configs(node_name)
+        submodule_configs = self._refresh_submodule_configs(node_name)
         
-        # Get all unique module names that have submodules with unique keys
-        module_names = list(set(
+        # Get all unique module names that have submodules with unique keys, in scan order
+        module_names = list(dict.fromkeys(
             config['module_name'] for config in submodule_configs.values()
             if config['has_unique_key_config']
         ))
         
-        return self.get_module_eps_calculation(module_names, node_name, period)
+        # The snapshot was just fetched and scanned; don't fetch and scan it again
+        return self._calculate_module_eps(module_names, node_name, period, submodule_configs)
     
     def get_quick_eps_summary(self, module_names: List[str], node_name: str, period: int = 1) -> Dict[str, Any]:
         """
@@ -866,26 +1869,29 @@ class ClusterManager:
         Returns:
             Simplified dict with EPS information for web interface
         """
-        full_eps_data = self.get_module_eps_calculation(module_names, node_name, period)
+        # Only the per-module numbers are needed, so skip the detailed result
+        submodule_configs = self._refresh_submodule_configs(node_name) if module_names else {}
+        module_eps_values = self._compute_eps(module_names, node_name, period, submodule_configs)
         
         # Create simplified summary for web interface
         quick_summary = {
             'node_name': node_name,
             'period_seconds': period,
-            'total_eps': full_eps_data['total_eps'],
+            'total_eps': 0,
             'module_count': len(module_names),
             'modules': []
         }
         
         for module_name in module_names:
-            if module_name in full_eps_data['modules']:
-                module_data = full_eps_data['modules'][module_name]
+            if module_name in module_eps_values:
+                module_unique_key, submodule_sum, submodule_count, module_eps = module_eps_values[module_name]
+                quick_summary['total_eps'] += module_eps
                 quick_summary['modules'].append({
                     'name': module_name,
-                    'eps': module_data['calculated_eps'],
-                    'module_unique_key': module_data['module_level_unique_key'],
-                    'submodule_count': module_data['submodule_count'],
-                    'submodule_keys_sum': module_data['submodule_unique_keys_sum']
+                    'eps': module_eps,
+                    'module_unique_key': module_unique_key,
+                    'submodule_count': submodule_count,
+                    'submodule_keys_sum': submodule_sum
                 })
             else:
                 # Module not found or has no unique key configs
@@ -899,7 +1905,7 @@ class ClusterManager:
                 })
         
         # Sort modules by EPS (highest first)
-        quick_summary['modules'].sort(key=lambda x: x['eps'], reverse=True)
+        quick_summary['modules'].sort(key=itemgetter('eps'), reverse=True)
         
         return quick_summary
     
@@ -978,51 +1984,89 @@ class ClusterManager:
             logger.warning(f"Node {node_name} is disabled")
             return False
             
-        ssh = None
-        sftp = None
-        
-        try:
-            # Create connection
-            ssh, sftp = self._create_ssh_connection(node_config)
+        self._invalidate_node_caches(node_name)
             
-            # Create local snapshot directory for this node
-            node_snapshot_dir = self.conf_snapshots_dir / node_name
-            conf_snapshot_dir = node_snapshot_dir / "conf.d"
-            
-            # Remove existing snapshot
-            if node_snapshot_dir.exists():
-                shutil.rmtree(node_snapshot_dir)
+        try:
+            with self._acquire(node_config) as (ssh, sftp):
+                # Create local snapshot directory for this node
+                node_snapshot_dir, conf_snapshot_dir = self._snapshot_dirs(node_name)
                 
-            # Sync remote conf.d directory
-            remote_conf_dir = node_config['conf_dir']
-            self.cluster_logger.info(f"Fetching configuration from {node_name} ({remote_conf_dir})")
-            
-            checksums = self._sync_directory_from_remote(
-                sftp, remote_conf_dir, conf_snapshot_dir, node_name
-            )
-            
-            # Save checksums for conflict detection
-            checksum_file = node_snapshot_dir / "checksums.yaml"
-            with open(checksum_file, 'w') as f:
-                yaml.dump({
-                    'timestamp': datetime.now().isoformat(),
-                    'node': node_name,
-                    'remote_path': remote_conf_dir,
-                    'checksums': checksums
-                }, f)
+                # Sync remote conf.d directory
+                remote_conf_dir = node_config['conf_dir']
+                self.cluster_logger.info(f"Fetching configuration from {node_name} ({remote_conf_dir})")
                 
-            self.cluster_logger.info(f"Successfully fetched {len(checksums)} files from {node_name}")
-            return True
-            
+                # Only download files whose size or mtime changed since the last sync
+                checksums = None
+                remote_tree = self._remote_tree(ssh, remote_conf_dir)
+                remote_manifest = None
+                if remote_tree is not None:
+                    remote_manifest = {
+                        path: (size, mtime) for entry_type, path, size, mtime in remote_tree
+                        if entry_type == 'f'
+                    }
+                previous = None
+                if remote_manifest is not None and conf_snapshot_dir.exists():
+                    previous = self._load_snapshot_manifest(node_snapshot_dir)
+                    try:
+                        if previous is not None:
+                            checksums = self._sync_changed_files(
+                                sftp, remote_conf_dir, conf_snapshot_dir, node_name,
+                                remote_manifest, previous
+                            )
+                        else:
+                            # No manifest yet: keep whatever local files already match the remote
+                            checksums = self._sync_changed_content(
+                                ssh, sftp, remote_conf_dir, conf_snapshot_dir, node_name,
+                                remote_manifest
+                            )
+                    except Exception as e:
+                        self.cluster_logger.warning(
+                            f"Incremental sync from {node_name} failed, doing a full sync: {e}"
+                        )
+                
+                if checksums is None:
+                    # Remove existing snapshot
+                    if node_snapshot_dir.exists():
+                        shutil.rmtree(node_snapshot_dir)
+                        
+                    if self._remote_has_tar(ssh):
+                        try:
+                            checksums = self._sync_directory_from_remote_tar(
+                                ssh, remote_conf_dir, conf_snapshot_dir, node_name
+                            )
+                        except Exception as e:
+                            self.cluster_logger.warning(
+                                f"Tar sync from {node_name} failed, falling back to SFTP: {e}"
+                            )
+                            shutil.rmtree(conf_snapshot_dir, ignore_errors=True)
+
+                    if checksums is None:
+                        checksums = self._sync_directory_from_remote(
+                            sftp, remote_conf_dir, conf_snapshot_dir, node_name, remote_tree
+                        )
+                        
+                if remote_manifest is not None:
+                    self._save_snapshot_manifest(node_snapshot_dir, remote_manifest, checksums)
+                else:
+                    (node_snapshot_dir / "manifest.json").unlink(missing_ok=True)
+            
+                # Save checksums for conflict detection
+                checksum_file = node_snapshot_dir / "checksums.yaml"
+                with open(checksum_file, 'w') as f:
+                    yaml.dump({
+                        'timestamp': datetime.now().isoformat(),
+                        'node': node_name,
+                        'remote_path': remote_conf_dir,
+                        'algorithm': CHECKSUM_ALGORITHM,
+                        'checksums': checksums
+                    }, f, Dumper=SafeDumper)
+                
+                self.cluster_logger.info(f"Successfully fetched {len(checksums)} files from {node_name}")
+                return True
+
         except Exception as e:
             self.cluster_logger.error(f"Error fetching config from {node_name}: {e}")
             return False
-            
-        finally:
-            if sftp:
-                sftp.close()
-            if ssh:
-                ssh.close()
     
     def fetch_all_configs(self) -> Dict[str, bool]:
         """
@@ -1036,8 +2080,10 @@ class ClusterManager:
         
         self.cluster_logger.info(f"Fetching configurations from {len(enabled_nodes)} nodes")
         
-        for node_name in enabled_nodes:
-            results[node_name] = self.fetch_node_config(node_name)
+        # Nodes are independent and the fetch is network-bound, so run them concurrently
+        for node_name, success in self._run_per_node(list(enabled_nodes), self.fetch_node_config):
+            results[node_name] = bool(success)
+        results = {name: results[name] for name in enabled_nodes}
             
         success_count = sum(1 for success in results.values() if success)
         self.cluster_logger.info(f"Successfully fetched from {success_count}/{len(enabled_nodes)} nodes")
@@ -1054,17 +2100,11 @@ class ClusterManager:
         Returns:
             List of Path objects for configuration files
         """
-        node_snapshot_dir = self.conf_snapshots_dir / node_name / "conf.d"
+        _, node_snapshot_dir = self._snapshot_dirs(node_name)
         if not node_snapshot_dir.exists():
             return []
             
-        files = []
-        for file_path in node_snapshot_dir.rglob("*.yaml"):
-            files.append(file_path)
-        for file_path in node_snapshot_dir.rglob("*.yml"):
-            files.append(file_path)
-            
-        return sorted(files)
+        return sorted(_find_files(node_snapshot_dir, (".yaml", ".yml")))
     
     def get_all_snapshot_files(self) -> Dict[str, List[Path]]:
         """Get all snapshot files organized by node"""
@@ -1091,7 +2131,7 @@ class ClusterManager:
             
             # Generate timestamped backup filename
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            relative_path = file_path.relative_to(self.conf_snapshots_dir / node_name)
+            relative_path = file_path.relative_to(self._snapshot_dirs(node_name)[0])
             backup_file = backup_dir / f"{relative_path.stem}_{timestamp}{relative_path.suffix}"
             backup_file.parent.mkdir(parents=True, exist_ok=True)
             
@@ -1129,32 +2169,21 @@ class ClusterManager:
             logger.warning(f"Node {node_name} is disabled")
             return False
             
-        ssh = None
-        sftp = None
-        
         try:
-            # Create connection
-            ssh, sftp = self._create_ssh_connection(node_config)
+            with self._acquire(node_config) as (ssh, sftp):
+                # Create backup if requested
+                if create_backup:
+                    self.create_backup(node_name, local_file)
             
-            # Create backup if requested
-            if create_backup:
-                self.create_backup(node_name, local_file)
-            
-            # Push file to remote
-            sftp.put(str(local_file), remote_file)
-            
-            self.cluster_logger.info(f"Pushed {local_file} to {node_name}:{remote_file}")
-            return True
+                # Push file to remote
+                self._sftp_upload(sftp, local_file, remote_file)
             
+                self.cluster_logger.info(f"Pushed {local_file} to {node_name}:{remote_file}")
+                return True
+
         except Exception as e:
             self.cluster_logger.error(f"Error pushing {local_file} to {node_name}: {e}")
             return False
-            
-        finally:
-            if sftp:
-                sftp.close()
-            if ssh:
-                ssh.close()
     
     def push_config_to_node(self, node_name: str, local_config_file: Path) -> bool:
         """
@@ -1169,7 +2198,7 @@ class ClusterManager:
         """
         try:
             # Calculate relative path within conf.d
-            node_snapshot_dir = self.conf_snapshots_dir / node_name / "conf.d"
+            _, node_snapshot_dir = self._snapshot_dirs(node_name)
             relative_path = local_config_file.relative_to(node_snapshot_dir)
             
             # Get remote conf.d path for this node
@@ -1203,38 +2232,28 @@ class ClusterManager:
             logger.warning(f"Node {node_name} is disabled")
             return False
             
-        ssh = None
-        
         try:
-            # Create SSH connection
-            ssh, _ = self._create_ssh_connection(node_config)
-            
-            # Commands to stop and start vuDataSim
-            binary_dir = node_config['binary_dir']
-            stop_cmd = f"pkill -f vuDataSim || true"
-            start_cmd = f"cd {binary_dir} && nohup ./vuDataSim > /dev/null 2>&1 &"
-            
-            # Stop existing process
-            stdin, stdout, stderr = ssh.exec_command(stop_cmd)
-            stdout.channel.recv_exit_status()  # Wait for command to complete
-            
-            # Wait a moment for processes to terminate
-            time.sleep(2)
-            
-            # Start new process
-            stdin, stdout, stderr = ssh.exec_command(start_cmd)
-            stdout.channel.recv_exit_status()  # Wait for command to complete
-            
-            self.cluster_logger.info(f"Restarted vuDataSim on {node_name}")
-            return True
+            with self._acquire(node_config) as (ssh, _):
+                # Stop, wait and start in one round trip. The script goes over stdin
+                # so the remote shell's command line does not match pkill -f vuDataSim
+                binary_dir = node_config['binary_dir']
+                restart_script = (
+                    "pkill -f vuDataSim || true\n"
+                    "sleep 2\n"
+                    f"cd {shlex.quote(binary_dir)} && nohup ./vuDataSim > /dev/null 2>&1 < /dev/null &\n"
+                )
+                
+                stdin, stdout, stderr = ssh.exec_command("sh -s")
+                stdin.write(restart_script)
+                stdin.close()
+                stdout.channel.recv_exit_status()  # Wait for command to complete
             
+                self.cluster_logger.info(f"Restarted vuDataSim on {node_name}")
+                return True
+
         except Exception as e:
             self.cluster_logger.error(f"Error restarting vuDataSim on {node_name}: {e}")
             return False
-            
-        finally:
-            if ssh:
-                ssh.close()
     
     def check_conflicts(self, node_name: str) -> Dict[str, Any]:
         """
@@ -1268,7 +2287,7 @@ class ClusterManager:
         }
         
         for node_name, node_config in nodes.items():
-            snapshot_dir = self.conf_snapshots_dir / node_name
+            snapshot_dir, _ = self._snapshot_dirs(node_name)
             has_snapshot = snapshot_dir.exists()
             
             # Get last sync time from checksums file if available
@@ -1277,7 +2296,7 @@ class ClusterManager:
             if checksum_file.exists():
                 try:
                     with open(checksum_file, 'r') as f:
-                        checksum_data = yaml.safe_load(f)
+                        checksum_data = yaml.load(f, Loader=SafeLoader)
                         last_sync = checksum_data.get('timestamp')
                 except Exception:
                     pass
@@ -1306,6 +2325,7 @@ class ClusterManager:
         result = {
             'success': False,
             'files_pushed': 0,
+            'files_skipped': 0,
             'total_files': 0,
             'failed_files': [],
             'errors': []
@@ -1321,18 +2341,17 @@ class ClusterManager:
             result['errors'].append(f"Node {node_name} is disabled")
             return result
         
+        self._invalidate_node_caches(node_name)
+        
         try:
             # Get all configuration files from the node's snapshot directory
-            local_config_dir = self.conf_snapshots_dir / node_name / "conf.d"
+            _, local_config_dir = self._snapshot_dirs(node_name)
             if not local_config_dir.exists():
                 result['errors'].append(f"Node snapshot directory not found: {local_config_dir}")
                 return result
             
             # Find all YAML files in the node's snapshot conf.d directory
-            config_files = []
-            for file_path in local_config_dir.rglob("*.yml"):
-                if file_path.is_file():
-                    config_files.append(file_path)
+            config_files = _find_files(local_config_dir, (".yml",))
             
             result['total_files'] = len(config_files)
             
@@ -1347,57 +2366,105 @@ class ClusterManager:
                 backup_name = f"bulk_push_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
                 self.cluster_logger.info(f"Creating backup: {backup_name}")
             
-            # Push each file
-            ssh = None
-            sftp = None
-            
-            try:
-                # Create single connection for all transfers
-                ssh, sftp = self._create_ssh_connection(node_config)
+            # Push files in parallel over several SFTP channels on the one SSH transport
+            with self._acquire(node_config) as (ssh, sftp):
                 remote_conf_dir = node_config['conf_dir'].rstrip('/')
                 
-                for local_file in config_files:
+                # Leave out files the node already has byte-for-byte
+                remote_checksums = self._remote_sha256(
+                    ssh, remote_conf_dir,
+                    [local_file.relative_to(local_config_dir).as_posix() for local_file in config_files]
+                )
+                if remote_checksums:
+                    changed_files = []
+                    for local_file in config_files:
+                        remote_checksum = remote_checksums.get(local_file.relative_to(local_config_dir).as_posix())
+                        if remote_checksum is not None and remote_checksum == _sha256_file(local_file):
+                            result['files_skipped'] += 1
+                        else:
+                            changed_files.append(local_file)
+                    config_files = changed_files
+                    self.cluster_logger.info(
+                        f"{result['files_skipped']} files already up to date on {node_name}, "
+                        f"pushing {len(config_files)}"
+                    )
+                
+                channel_count = min(MAX_PUSH_CHANNELS, len(config_files))
+                channels: queue.Queue = queue.Queue()
+                channels.put(sftp)
+                extra_channels = []
+                try:
+                    transport = ssh.get_transport()
+                    for _ in range(channel_count - 1):
+                        extra_channels.append(paramiko.SFTPClient.from_transport(transport))
+                        channels.put(extra_channels[-1])
+                except Exception as e:
+                    self.cluster_logger.debug(f"Using {channels.qsize()} SFTP channel(s) for {node_name}: {e}")
+                
+                # Ensure every remote directory exists with one command up front
+                remote_dirs = sorted({
+                    os.path.dirname(f"{remote_conf_dir}/{local_file.relative_to(local_config_dir)}")
+                    for local_file in config_files
+                })
+                try:
+                    if remote_dirs:
+                        _, stdout, stderr = ssh.exec_command(
+                            "mkdir -p " + " ".join(shlex.quote(d) for d in remote_dirs)
+                        )
+                        if stdout.channel.recv_exit_status() != 0:
+                            self.cluster_logger.warning(
+                                f"mkdir on {node_name} reported: "
+                                f"{stderr.read().decode('utf-8', errors='replace').strip()}"
+                            )
+                except Exception as e:
+                    self.cluster_logger.warning(f"Could not create remote directories on {node_name}: {e}")
+                
+                def push_one(local_file: Path) -> Path:
+                    # Calculate relative path
+                    relative_path = local_file.relative_to(local_config_dir)
+                    remote_file_path = f"{remote_conf_dir}/{relative_path}"
+                    
+                    # Push the file on whichever channel is free
+                    channel = channels.get()
                     try:
-                        # Calculate relative path
-                        relative_path = local_file.relative_to(local_config_dir)
-                        remote_file_path = f"{remote_conf_dir}/{relative_path}"
-                        
-                        # Ensure remote directory exists
-                        remote_dir = os.path.dirname(remote_file_path)
+                        self._sftp_upload(channel, local_file, remote_file_path)
+                    finally:
+                        channels.put(channel)
+                    return relative_path
+                
+                try:
+                    with ThreadPoolExecutor(max_workers=channels.qsize()) as pool:
+                        futures = {pool.submit(push_one, local_file): local_file for local_file in config_files}
+                        for future in as_completed(futures):
+                            local_file = futures[future]
+                            try:
+                                relative_path = future.result()
+                                result['files_pushed'] += 1
+                                
+                                self.cluster_logger.info(f"Pushed {relative_path} to {node_name}")
+                                
+                            except Exception as e:
+                                error_msg = f"Failed to push {local_file.name}: {str(e)}"
+                                result['failed_files'].append({
+                                    'file': str(local_file),
+                                    'error': error_msg
+                                })
+                                self.cluster_logger.error(f"Error pushing {local_file} to {node_name}: {e}")
+                finally:
+                    for channel in extra_channels:
                         try:
-                            ssh.exec_command(f"mkdir -p '{remote_dir}'")
-                            time.sleep(0.1)  # Brief pause for directory creation
+                            channel.close()
                         except Exception:
-                            pass  # Directory might already exist
-                        
-                        # Push the file
-                        sftp.put(str(local_file), remote_file_path)
-                        result['files_pushed'] += 1
-                        
-                        self.cluster_logger.info(f"Pushed {relative_path} to {node_name}")
-                        
-                    except Exception as e:
-                        error_msg = f"Failed to push {local_file.name}: {str(e)}"
-                        result['failed_files'].append({
-                            'file': str(local_file),
-                            'error': error_msg
-                        })
-                        self.cluster_logger.error(f"Error pushing {local_file} to {node_name}: {e}")
-                
-            finally:
-                if sftp:
-                    sftp.close()
-                if ssh:
-                    ssh.close()
+                            pass
             
             # Determine overall success
-            result['success'] = result['files_pushed'] > 0
+            result['success'] = result['files_pushed'] + result['files_skipped'] > 0
             
             if result['success']:
-                success_rate = (result['files_pushed'] / result['total_files']) * 100
+                success_rate = ((result['files_pushed'] + result['files_skipped']) / result['total_files']) * 100
                 self.cluster_logger.info(
                     f"Bulk push to {node_name} completed: {result['files_pushed']}/{result['total_files']} "
-                    f"files ({success_rate:.1f}% success rate)"
+                    f"files pushed, {result['files_skipped']} unchanged ({success_rate:.1f}% success rate)"
                 )
             else:
                 self.cluster_logger.error(f"Bulk push to {node_name} failed: no files were pushed")
@@ -1428,9 +2495,23 @@ class ClusterManager:
         
         self.cluster_logger.info(f"Starting bulk push to {len(target_nodes)} nodes: {target_nodes}")
         
-        for node_name in target_nodes:
+        def push_node(node_name: str) -> Dict[str, Any]:
             self.cluster_logger.info(f"Processing node: {node_name}")
-            results[node_name] = self.push_all_local_configs_to_node(node_name, create_backup)
+            return self.push_all_local_configs_to_node(node_name, create_backup)
+        
+        # Each node push uses its own pooled connection, so nodes can run concurrently
+        for node_name, node_result in self._run_per_node(target_nodes, push_node):
+            if node_result is None:
+                node_result = {
+                    'success': False,
+                    'files_pushed': 0,
+                    'files_skipped': 0,
+                    'total_files': 0,
+                    'failed_files': [],
+                    'errors': [f"Push to {node_name} failed unexpectedly"]
+                }
+            results[node_name] = node_result
+        results = {name: results[name] for name in target_nodes if name in results}
         
         # Log summary
         successful_nodes = sum(1 for result in results.values() if result['success'])
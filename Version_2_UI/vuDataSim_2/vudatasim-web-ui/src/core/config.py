@@ -2,9 +2,33 @@
 Configuration settings for vuDataSim Web UI
 """
 import os
+import copy
+import functools
+import logging
 import yaml
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Tuple
+
+# Prefer the libyaml C bindings; fall back to the pure-Python implementation
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+logger = logging.getLogger(__name__)
+
+# Parsed config files keyed by path: (st_mtime_ns, st_size, parsed data), least recently used first
+_YAML_CACHE: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+_YAML_CACHE_SIZE = 100
+
+# Marks a key that is not present in the config
+_MISSING = object()
+
+@functools.lru_cache(maxsize=256)
+def _split_path(key_path: str) -> Tuple[str, ...]:
+    """Split a dotted config path, once per distinct path"""
+    return tuple(key_path.split('.'))
 
 class Config:
     """Configuration manager that loads settings from YAML file"""
@@ -13,18 +37,50 @@ class Config:
         self.base_dir = Path(__file__).parent.parent.parent
         self.config_file = self.base_dir / "config.yaml"
         self._config_data = self._load_config()
+        self._flat = self._flat_index(self._config_data)
+        
+    @staticmethod
+    def _flatten(data: Dict[str, Any], prefix: str = '') -> Iterator[Tuple[str, Any]]:
+        """Yield (dotted path, value) for every key, including nested sections"""
+        for key, value in data.items():
+            path = f"{prefix}{key}"
+            yield path, value
+            if isinstance(value, dict):
+                yield from Config._flatten(value, f"{path}.")
+        
+    @classmethod
+    def _flat_index(cls, data: Any) -> Dict[str, Any]:
+        """Dotted-path lookup table for a parsed config; empty if config.yaml is not a mapping"""
+        if not isinstance(data, dict):
+            return {}
+        return dict(cls._flatten(data))
         
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file"""
         try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    return yaml.safe_load(f) or {}
-            else:
+            try:
+                st = self.config_file.stat()
+            except FileNotFoundError:
                 # Return default configuration if file doesn't exist
                 return self._get_default_config()
+            
+            # Reuse the previous parse while the file is unchanged; callers get
+            # their own copy because update_value mutates nested sections
+            key = str(self.config_file)
+            cached = _YAML_CACHE.get(key)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                _YAML_CACHE.move_to_end(key)
+                return copy.deepcopy(cached[2])
+            
+            with open(self.config_file, 'r') as f:
+                config_data = yaml.load(f, Loader=SafeLoader) or {}
+            _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, config_data)
+            _YAML_CACHE.move_to_end(key)
+            if len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+                _YAML_CACHE.popitem(last=False)
+            return copy.deepcopy(config_data)
         except Exception as e:
-            print(f"Warning: Could not load config.yaml: {e}")
+            logger.warning("Could not load config.yaml: %s", e)
             return self._get_default_config()
     
     def _get_default_config(self) -> Dict[str, Any]:
@@ -67,26 +123,23 @@ class Config:
     
     def get(self, key_path: str, default=None):
         """Get configuration value using dot notation (e.g., 'network.remote_host')"""
-        keys = key_path.split('.')
-        value = self._config_data
-        
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
-        
-        return value
+        return self._flat.get(key_path, default)
     
     def reload(self):
         """Reload configuration from YAML file"""
         self._config_data = self._load_config()
+        self._flat = self._flat_index(self._config_data)
         return self._config_data
     
     def update_value(self, key_path: str, value):
         """Update a configuration value and save to YAML file"""
-        keys = key_path.split('.')
-        config_dict = self._config_data.copy()
+        # Setting a value to what it already is needs no write
+        current_value = self._flat.get(key_path, _MISSING)
+        if type(current_value) is type(value) and current_value == value:
+            return True
+        
+        keys = _split_path(key_path)
+        config_dict = copy.deepcopy(self._config_data)
         
         # Navigate to the correct nested location
         current = config_dict
@@ -98,62 +151,99 @@ class Config:
         # Set the value
         current[keys[-1]] = value
         
-        # Save to file
+        # Save to a temporary file and swap it in, so a failed write never leaves a partial config.yaml
+        temp_file = self.config_file.with_suffix('.yaml.tmp')
         try:
-            with open(self.config_file, 'w') as f:
-                yaml.dump(config_dict, f, default_flow_style=False, indent=2)
+            with open(temp_file, 'w') as f:
+                yaml.dump(config_dict, f, Dumper=SafeDumper, default_flow_style=False, indent=2)
+            os.replace(temp_file, self.config_file)
+            _YAML_CACHE.pop(str(self.config_file), None)
             self._config_data = config_dict
+            self._flat = self._flat_index(self._config_data)
             return True
         except Exception as e:
-            print(f"Error saving configuration: {e}")
+            logger.error("Error saving configuration: %s", e)
             return False
 
-# Create global config instance
-_config = Config()
-
-# Function to get config instance
-def get_config():
+# Function to get config instance; the first call creates it
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
     """Get the global configuration instance"""
-    return _config
+    return Config()
 
-# Base paths
-BASE_DIR = _config.base_dir
-BIN_DIR = BASE_DIR.parent / "bin"
-LOGS_DIR = BASE_DIR / _config.get('paths.local_logs_dir', 'logs')
-BACKUPS_DIR = BASE_DIR / _config.get('paths.local_backups_dir', 'backups')
+def _setting(key_path: str, default):
+    """Resolver for a constant read from config.yaml"""
+    return lambda: get_config().get(key_path, default)
 
-# Binary configuration
-PRIMARY_BINARY = _config.get('binaries.primary_binary', 'vuDataSim')
-SUPPORTED_BINARIES = _config.get('binaries.supported_binaries', ['vuDataSim'])
+def _base_path(*parts: str, key_path: str = None, default: str = None):
+    """Resolver for a path under BASE_DIR (or its parent, via '..')"""
+    def resolve():
+        path = get_config().base_dir
+        for part in parts:
+            path = path.parent if part == '..' else path / part
+        if key_path is not None:
+            path = path / get_config().get(key_path, default)
+        return path
+    return resolve
 
-# YAML configuration (keeping for backward compatibility)
-CONF_D_DIR = BASE_DIR.parent / "conf.d"
-MAIN_CONFIG_FILE = CONF_D_DIR / "conf.yml"
-MODULE_CONFIG_FILE = "conf.yml"
+def _log_file():
+    logs_dir = __getattr__('LOGS_DIR')
+    return logs_dir / get_config().get('logging.log_file', 'vudatasim-webui.log') if logs_dir.exists() else None
+
+# Module constants, resolved from config on first access (PEP 562) rather than at import
+_LAZY = {
+    # Base paths
+    'BASE_DIR': _base_path(),
+    'BIN_DIR': _base_path('..', 'bin'),
+    'LOGS_DIR': _base_path(key_path='paths.local_logs_dir', default='logs'),
+    'BACKUPS_DIR': _base_path(key_path='paths.local_backups_dir', default='backups'),
+
+    # Binary configuration
+    'PRIMARY_BINARY': _setting('binaries.primary_binary', 'vuDataSim'),
+    'SUPPORTED_BINARIES': _setting('binaries.supported_binaries', ['vuDataSim']),
 
-# Process management
-DEFAULT_TIMEOUT = _config.get('process.default_timeout', 300)
-GRACEFUL_SHUTDOWN_TIMEOUT = _config.get('process.graceful_shutdown_timeout', 10)
+    # YAML configuration (keeping for backward compatibility)
+    'CONF_D_DIR': _base_path('..', 'conf.d'),
+    'MAIN_CONFIG_FILE': _base_path('..', 'conf.d', 'conf.yml'),
 
-# EPS calculation
-DEFAULT_UNIQUE_KEY = _config.get('eps.default_unique_key', 1)
-MAX_UNIQUE_KEY = _config.get('eps.max_unique_key', 1000000000)
+    # Process management
+    'DEFAULT_TIMEOUT': _setting('process.default_timeout', 300),
+    'GRACEFUL_SHUTDOWN_TIMEOUT': _setting('process.graceful_shutdown_timeout', 10),
 
-# UI configuration
-STREAMLIT_PORT = _config.get('network.streamlit_port', 8501)
-STREAMLIT_ADDRESS = _config.get('network.streamlit_address', '0.0.0.0')
+    # EPS calculation
+    'DEFAULT_UNIQUE_KEY': _setting('eps.default_unique_key', 1),
+    'MAX_UNIQUE_KEY': _setting('eps.max_unique_key', 1000000000),
 
-# Logging
-LOG_FILE = LOGS_DIR / _config.get('logging.log_file', 'vudatasim-webui.log') if LOGS_DIR.exists() else None
-LOG_MAX_SIZE = _config.get('logging.log_max_size', 10485760)
-LOG_BACKUP_COUNT = _config.get('logging.log_backup_count', 5)
+    # UI configuration
+    'STREAMLIT_PORT': _setting('network.streamlit_port', 8501),
+    'STREAMLIT_ADDRESS': _setting('network.streamlit_address', '0.0.0.0'),
+
+    # Logging
+    'LOG_FILE': _log_file,
+    'LOG_MAX_SIZE': _setting('logging.log_max_size', 10485760),
+    'LOG_BACKUP_COUNT': _setting('logging.log_backup_count', 5),
+
+    # Backup configuration
+    'BACKUP_RETENTION_DAYS': _setting('backup.retention_days', 7),
+
+    # Remote SSH configuration for binary execution
+    'REMOTE_HOST': _setting('network.remote_host', '216.48.191.10'),
+    'REMOTE_USER': _setting('network.remote_user', 'vunet'),
+    'REMOTE_SSH_KEY_PATH': _setting('paths.remote_ssh_key', '~/.ssh/id_rsa'),
+    'REMOTE_BINARY_DIR': _setting('paths.remote_binary_dir', '/home/vunet/vuDataSim/vuDataSim/bin/'),
+    'REMOTE_TIMEOUT': _setting('process.remote_timeout', 300),
+}
+
+MODULE_CONFIG_FILE = "conf.yml"
 
-# Backup configuration
-BACKUP_RETENTION_DAYS = _config.get('backup.retention_days', 7)
+def __getattr__(name: str):
+    """Resolve a module constant on first access and keep it as a plain global"""
+    try:
+        resolve = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = globals()[name] = resolve()
+    return value
 
-# Remote SSH configuration for binary execution
-REMOTE_HOST = _config.get('network.remote_host', '216.48.191.10')
-REMOTE_USER = _config.get('network.remote_user', 'vunet')
-REMOTE_SSH_KEY_PATH = _config.get('paths.remote_ssh_key', '~/.ssh/id_rsa')
-REMOTE_BINARY_DIR = _config.get('paths.remote_binary_dir', '/home/vunet/vuDataSim/vuDataSim/bin/')
-REMOTE_TIMEOUT = _config.get('process.remote_timeout', 300)
\ No newline at end of file
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
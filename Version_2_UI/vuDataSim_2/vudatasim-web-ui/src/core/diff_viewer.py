@@ -3,91 +3,244 @@ Diff preview system for YAML changes
 """
 import difflib
 import io
-from typing import Dict, Any, List, Tuple
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Callable, List, Optional, Tuple
+from .config import CONF_D_DIR
 from .yaml_editor import yaml_editor
 
-class DiffViewer:
-    """Generate and display diffs for YAML changes"""
+# Number of parsed and serialized original files kept between previews
+ORIGINAL_CACHE_SIZE = 64
 
-    def generate_yaml_diff(self, original_content: str, new_content: str) -> str:
-        """Generate unified diff between two YAML strings"""
-        original_lines = original_content.splitlines(keepends=True)
-        new_lines = new_content.splitlines(keepends=True)
+# Number of preview results kept for repeated identical requests
+PREVIEW_CACHE_SIZE = 256
 
-        diff = list(difflib.unified_diff(
-            original_lines,
-            new_lines,
-            fromfile='original',
-            tofile='modified',
-            lineterm='',
-            n=3  # Context lines
-        ))
+# Diffs shorter than this are shown whole as the clean diff instead of being filtered
+CLEAN_DIFF_MIN_LINES = 40
 
-        return '\n'.join(diff) if diff else "No changes detected"
+class DiffViewer:
+    """Generate and display diffs for YAML changes"""
+
+    def __init__(self):
+        # (path, mtime_ns, size) -> (parsed config, serialized YAML, its lines), least recently used first
+        self._orig_cache: "OrderedDict[Tuple[str, int, int], Tuple[Dict[str, Any], str, List[str]]]" = OrderedDict()
+        # (preview arguments, file mtime_ns, size) -> preview result, least recently used first
+        self._preview_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        # Guards both caches; the shared viewer is used from every Streamlit session thread
+        self._cache_lock = threading.Lock()
+        # Per-thread StringIO reused for every YAML dump (Streamlit serves sessions on separate threads)
+        self._local = threading.local()
+
+    def _dump_yaml(self, config: Dict[str, Any]) -> str:
+        """Serialize a config with the round-trip YAML instance"""
+        buf = getattr(self._local, "buf", None)
+        if buf is None:
+            buf = self._local.buf = io.StringIO()
+        buf.seek(0)
+        buf.truncate(0)
+        yaml_editor.yaml.dump(config, buf)
+        return buf.getvalue()
+
+    def _file_signature(self, config_path: Path) -> Optional[Tuple[int, int]]:
+        """(st_mtime_ns, st_size) of a config file, or None if it does not exist"""
+        try:
+            st = config_path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _cached_preview(self, key: Optional[tuple], build: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Return the preview for key, building it on a miss (or always if key is None)
+
+        Results are shared between callers and must not be mutated; failed
+        previews are not cached so they are retried on the next call.
+        """
+        if key is None:
+            return build()
+        with self._cache_lock:
+            cached = self._preview_cache.get(key)
+            if cached is not None:
+                self._preview_cache.move_to_end(key)
+                return cached
+
+        result = build()
+        if "error" not in result["diffs"]:
+            with self._cache_lock:
+                self._preview_cache[key] = result
+                if len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+                    self._preview_cache.popitem(last=False)
+        return result
+
+    def _read_original(self, config_path: Path,
+                       read_config: Callable[[], Tuple[Dict[str, Any], str]]) -> Tuple[Dict[str, Any], str, List[str]]:
+        """
+        Parsed config, its YAML dump and the dump split into lines, reused while the file is unchanged
+
+        The cached values are shared between previews and must not be mutated.
+        """
+        signature = self._file_signature(config_path)
+        if signature is None:
+            # Let the editor raise its usual "config not found" error
+            read_config()
+            raise FileNotFoundError(f"Config not found: {config_path}")
+        key = (str(config_path), *signature)
+        with self._cache_lock:
+            cached = self._orig_cache.get(key)
+            if cached is not None:
+                self._orig_cache.move_to_end(key)
+                return cached
+
+        config, _ = read_config()
+        original_content = self._dump_yaml(config)
+        entry = (config, original_content, self._split_lines(original_content))
+        with self._cache_lock:
+            self._orig_cache[key] = entry
+            if len(self._orig_cache) > ORIGINAL_CACHE_SIZE:
+                self._orig_cache.popitem(last=False)
+        return entry
+
+    def _split_lines(self, content: str) -> List[str]:
+        """Split text into lines that all end with a newline"""
+        lines = content.splitlines(keepends=True)
+        if lines and not lines[-1].endswith('\n'):
+            lines[-1] += '\n'
+        return lines
+
+    def generate_yaml_diff(self, original_content: str, new_content: str,
+                           original_lines: Optional[List[str]] = None) -> str:
+        """
+        Generate unified diff between two YAML strings
+
+        original_lines may be passed when the caller already has
+        original_content split by _split_lines.
+        """
+        # Nothing changed (e.g. the value was set back to what it was): skip splitting and matching
+        if original_content == new_content:
+            return "No changes detected"
+
+        if original_lines is None:
+            original_lines = self._split_lines(original_content)
+        new_lines = self._split_lines(new_content)
+
+        # Match on per-line hashes so SequenceMatcher compares ints rather than strings
+        original_hashes = tuple(map(hash, original_lines))
+        new_hashes = tuple(map(hash, new_lines))
+        if original_hashes == new_hashes:
+            return "No changes detected"
+
+        # Same hunks and format as difflib.unified_diff; the input lines keep their newlines
+        matcher = difflib.SequenceMatcher(None, original_hashes, new_hashes)
+        diff = io.StringIO()
+        for group in matcher.get_grouped_opcodes(3):  # 3 context lines
+            if not diff.tell():
+                diff.write('--- original\n+++ modified\n')
+            first, last = group[0], group[-1]
+            diff.write(f"@@ -{self._hunk_range(first[1], last[2])} "
+                       f"+{self._hunk_range(first[3], last[4])} @@\n")
+            for tag, i1, i2, j1, j2 in group:
+                if tag == 'equal':
+                    diff.writelines(' ' + line for line in original_lines[i1:i2])
+                    continue
+                if tag in ('replace', 'delete'):
+                    diff.writelines('-' + line for line in original_lines[i1:i2])
+                if tag in ('replace', 'insert'):
+                    diff.writelines('+' + line for line in new_lines[j1:j2])
+
+        return diff.getvalue() or "No changes detected"
+
+    @staticmethod
+    def _hunk_range(start: int, stop: int) -> str:
+        """Format a hunk line range the way unified diffs do"""
+        length = stop - start
+        if length == 1:
+            return str(start + 1)
+        return f"{start + 1 if length else start},{length}"
 
     def generate_token_diff(self, module_name: str, changes: Dict[str, Any]) -> Dict[str, str]:
         """Generate token-level diffs for specific changes"""
         diffs = {}
+        # Filter once; the diff, the line filter and the summary all use the same pairs
+        normalized = self._normalize_changes(changes)
+        changes = dict(normalized)
 
         try:
             # Read current file content
-            config, _ = yaml_editor.read_module_config(module_name)
-            string_stream = io.StringIO()
-            yaml_editor.yaml.dump(config, string_stream)
-            original_content = string_stream.getvalue()
+            config, original_content, original_lines = self._read_original(
+                CONF_D_DIR / module_name / "conf.yml",
+                lambda: yaml_editor.read_module_config(module_name)
+            )
 
-            # Apply changes to create new content
+            # Apply changes to create new content, copying only the sections that change
             modified_config = config.copy()
             if "uniquekey" in changes:
-                if "uniquekey" not in modified_config:
-                    modified_config["uniquekey"] = {}
-                modified_config["uniquekey"]["NumUniqKey"] = changes["uniquekey"]
+                modified_config["uniquekey"] = self._with_num_uniq_key(config, changes["uniquekey"])
 
             if "period" in changes:
                 modified_config["period"] = changes["period"]
 
-            string_stream = io.StringIO()
-            yaml_editor.yaml.dump(modified_config, string_stream)
-            new_content = string_stream.getvalue()
+            new_content = self._dump_yaml(modified_config)
 
             # Generate diff
-            full_diff = self.generate_yaml_diff(original_content, new_content)
+            full_diff = self.generate_yaml_diff(original_content, new_content, original_lines)
 
             # Extract only the changed sections for cleaner display
-            clean_diff = self._extract_key_changes(full_diff, changes)
+            clean_diff = self._clean_diff(full_diff, normalized)
 
             diffs["full_diff"] = full_diff
             diffs["clean_diff"] = clean_diff
-            diffs["summary"] = self._generate_change_summary(changes)
+            diffs["summary"] = self._generate_change_summary(normalized)
 
         except Exception as e:
             diffs["error"] = f"Error generating diff: {e}"
 
         return diffs
 
-    def _extract_key_changes(self, full_diff: str, changes: Dict[str, Any]) -> str:
+    def _with_num_uniq_key(self, config: Dict[str, Any], new_uniquekey: int) -> Dict[str, Any]:
+        """Copy of the config's uniquekey section with NumUniqKey set, leaving the original untouched"""
+        uniquekey = config.get("uniquekey")
+        uniquekey = uniquekey.copy() if uniquekey is not None else {}
+        uniquekey["NumUniqKey"] = new_uniquekey
+        return uniquekey
+
+    def _normalize_changes(self, changes: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+        """(key, value) pairs of the changes that are actually set"""
+        return tuple((key, value) for key, value in changes.items() if value is not None)
+
+    def _clean_diff(self, full_diff: str, changes: Tuple[Tuple[str, Any], ...]) -> str:
+        """The diff to display: short diffs as they are, longer ones reduced to the relevant lines"""
+        if full_diff.count('\n') < CLEAN_DIFF_MIN_LINES:
+            return full_diff
+        return self._extract_key_changes(full_diff, changes)
+
+    def _extract_key_changes(self, full_diff: str, changes: Tuple[Tuple[str, Any], ...]) -> str:
         """Extract only the relevant changed lines"""
         lines = full_diff.split('\n')
         relevant_lines = []
 
+        # One alternation of the changed values, so each line is searched once
+        values = [re.escape(str(value)) for _, value in changes]
+        value_re = re.compile('|'.join(values)) if values else None
+
         for line in lines:
-            # Look for lines that contain our changed values
-            if any(str(value) in line for value in changes.values() if value is not None):
-                relevant_lines.append(line)
-            elif line.startswith('@@') or line.startswith('+++') or line.startswith('---'):
+            # Keep hunk/file headers and lines that contain our changed values
+            if line.startswith(('@@', '+++', '---')) or (value_re is not None and value_re.search(line)):
                 relevant_lines.append(line)
 
         return '\n'.join(relevant_lines) if relevant_lines else "No significant changes detected"
 
-    def _generate_change_summary(self, changes: Dict[str, Any]) -> str:
+    def _generate_change_summary(self, changes: Tuple[Tuple[str, Any], ...]) -> str:
         """Generate human-readable summary of changes"""
         summary_parts = []
+        values = dict(changes)
 
-        if "uniquekey" in changes:
-            summary_parts.append(f"NumUniqKey: {changes['uniquekey']}")
+        if "uniquekey" in values:
+            summary_parts.append(f"NumUniqKey: {values['uniquekey']}")
 
-        if "period" in changes:
-            summary_parts.append(f"Period: {changes['period']}")
+        if "period" in values:
+            summary_parts.append(f"Period: {values['period']}")
 
         return " → ".join(summary_parts) if summary_parts else "No changes"
 
@@ -103,11 +256,16 @@ class DiffViewer:
         if not changes:
             return {"diffs": {}, "message": "No changes to preview"}
 
-        return {
-            "diffs": self.generate_token_diff(module_name, changes),
-            "changes": changes,
-            "module_name": module_name
-        }
+        # Streamlit reruns ask for the same preview repeatedly; reuse it while the file is unchanged
+        signature = self._file_signature(CONF_D_DIR / module_name / "conf.yml")
+        return self._cached_preview(
+            ("module", module_name, signature, new_uniquekey, new_period) if signature else None,
+            lambda: {
+                "diffs": self.generate_token_diff(module_name, changes),
+                "changes": changes,
+                "module_name": module_name
+            }
+        )
 
     def preview_submodule_changes(self, module_name: str, submodule_name: str,
                                  new_uniquekey: int = None) -> Dict[str, Any]:
@@ -119,26 +277,31 @@ class DiffViewer:
         if not changes:
             return {"diffs": {}, "message": "No changes to preview"}
 
+        signature = self._file_signature(CONF_D_DIR / module_name / f"{submodule_name}.yml")
+        return self._cached_preview(
+            ("submodule", module_name, submodule_name, signature, new_uniquekey) if signature else None,
+            lambda: self._build_submodule_preview(module_name, submodule_name, new_uniquekey, changes)
+        )
+
+    def _build_submodule_preview(self, module_name: str, submodule_name: str, new_uniquekey: int,
+                                 changes: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the preview returned by preview_submodule_changes"""
         try:
             # Read current submodule config
-            config, _ = yaml_editor.read_submodule_config(module_name, submodule_name)
-            string_stream = io.StringIO()
-            yaml_editor.yaml.dump(config, string_stream)
-            original_content = string_stream.getvalue()
+            config, original_content, original_lines = self._read_original(
+                CONF_D_DIR / module_name / f"{submodule_name}.yml",
+                lambda: yaml_editor.read_submodule_config(module_name, submodule_name)
+            )
 
             # Apply changes
             modified_config = config.copy()
-            if "uniquekey" not in modified_config:
-                modified_config["uniquekey"] = {}
-            modified_config["uniquekey"]["NumUniqKey"] = new_uniquekey
+            modified_config["uniquekey"] = self._with_num_uniq_key(config, new_uniquekey)
 
-            string_stream = io.StringIO()
-            yaml_editor.yaml.dump(modified_config, string_stream)
-            new_content = string_stream.getvalue()
+            new_content = self._dump_yaml(modified_config)
 
             # Generate diff
-            full_diff = self.generate_yaml_diff(original_content, new_content)
-            clean_diff = self._extract_key_changes(full_diff, changes)
+            full_diff = self.generate_yaml_diff(original_content, new_content, original_lines)
+            clean_diff = self._clean_diff(full_diff, self._normalize_changes(changes))
 
             return {
                 "diffs": {
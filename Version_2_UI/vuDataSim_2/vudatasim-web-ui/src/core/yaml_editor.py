@@ -341,6 +341,19 @@ class SafeYAMLEditor:
             enabled: New enabled state
             original_checksum: Checksum from when file was read
 
+        Returns:
+            Dict with operation results
+        """
+        return self.toggle_modules_bulk({module_name: enabled}, original_checksum)
+
+    def toggle_modules_bulk(self, changes: Dict[str, bool], original_checksum: str) -> Dict[str, Any]:
+        """
+        Set the enabled status of several modules in main config with a single write
+
+        Args:
+            changes: Mapping of module name to new enabled state
+            original_checksum: Checksum from when file was read
+
         Returns:
             Dict with operation results
         """
@@ -350,15 +363,18 @@ class SafeYAMLEditor:
         if current_checksum != original_checksum:
             raise ValueError("Main config has been modified since it was read")
 
-        # Update the specific module
+        # Update the specific modules
         if "include_module_dirs" not in data:
             raise ValueError("include_module_dirs section not found in main config")
 
-        if module_name not in data["include_module_dirs"]:
-            raise ValueError(f"Module {module_name} not found in include_module_dirs")
+        modules = data["include_module_dirs"]
+        missing = [name for name in changes if name not in modules]
+        if missing:
+            raise ValueError(f"Module {', '.join(missing)} not found in include_module_dirs")
 
-        # Update only the enabled field
-        data["include_module_dirs"][module_name]["enabled"] = enabled
+        # Update only the enabled fields
+        for module_name, enabled in changes.items():
+            modules[module_name]["enabled"] = enabled
 
         # Write back
         return self.write_main_config(data, original_checksum)
@@ -5,9 +5,13 @@ import streamlit as st
 import logging
 import sys
 import os
+import re
+import functools
+import threading
 from pathlib import Path
-import pandas as pd
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Tuple
 
 # Add parent directories to path for imports
 sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
@@ -16,23 +20,31 @@ sys.path.append(str(Path(__file__).resolve().parent.parent))
 from core.config import (
     PRIMARY_BINARY, SUPPORTED_BINARIES, DEFAULT_TIMEOUT,
     STREAMLIT_PORT, STREAMLIT_ADDRESS, LOG_FILE, LOGS_DIR,
-    REMOTE_HOST, REMOTE_USER, REMOTE_TIMEOUT
+    REMOTE_HOST, REMOTE_USER, REMOTE_TIMEOUT, MAIN_CONFIG_FILE, CONF_D_DIR
 )
-from core.binary_manager import process_manager
+from core.binary_manager import process_manager, REMOTE_LOG_TAIL_BYTES
 from core.yaml_editor import yaml_editor
 from core.eps_calculator import eps_calculator
 from core.diff_viewer import diff_viewer
-from core.clickhouse_monitor import ClickHouseMonitor
-clickhouse_monitor = ClickHouseMonitor(
-    host="10.32.3.50",
-    port=9000,
-    database="monitoring",
-    user="vuDataSim_tool",
-    password="StrongPassword123"
-)
 
 
-# Configure logging
+@st.cache_resource
+def get_clickhouse_monitor():
+    """Shared ClickHouse monitor; built once per server process instead of on every rerun"""
+    # Imported here so the ClickHouse driver only loads once a page actually queries it
+    from core.clickhouse_monitor import ClickHouseMonitor
+
+    return ClickHouseMonitor(
+        host="10.32.3.50",
+        port=9000,
+        database="monitoring",
+        user="vuDataSim_tool",
+        password="StrongPassword123"
+    )
+
+
+# Configure logging (root level and console format, which importing core.clickhouse_monitor used to set up)
+logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
 logger = logging.getLogger(__name__)
 
 # Ensure required directories exist
@@ -60,151 +72,94 @@ st.set_page_config(
 )
 
 # Enhanced CSS for new grouped design
-st.markdown("""
-<style>
-    /* Main header with gradient */
-    .main-header {
-        font-size: 2.2rem;
-        font-weight: bold;
-        color: #4F46E5;
-        text-align: center;
-        margin-bottom: 1.5rem;
-        background: linear-gradient(135deg, #4F46E5, #10B981);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-    }
-    
-    /* Sidebar header styling */
-    .sidebar-header {
-        font-size: 1.3rem;
-        font-weight: bold;
-        color: #4F46E5;
-        margin-bottom: 1rem;
-        text-align: center;
-        padding: 0.5rem;
-        background: linear-gradient(135deg, #F3F4F6, #E5E7EB);
-        border-radius: 0.5rem;
-        border-left: 4px solid #4F46E5;
-    }
-    
-    /* Enhanced metric cards */
-    .metric-card {
-        background: linear-gradient(135deg, #F8FAFC, #F1F5F9);
-        padding: 1.5rem;
-        border-radius: 1rem;
-        margin: 1rem 0;
-        border-left: 4px solid #4F46E5;
-        box-shadow: 0 4px 12px rgba(79, 70, 229, 0.1);
-        transition: all 0.3s ease;
-    }
-    .metric-card:hover {
-        transform: translateY(-4px);
-        box-shadow: 0 8px 20px rgba(79, 70, 229, 0.15);
-        border-left-color: #10B981;
-    }
-    
-    /* Status indicators with new color scheme */
-    .status-running {
-        color: #10B981;
-        font-weight: bold;
-        font-size: 1.1em;
-    }
-    .status-stopped {
-        color: #EF4444;
-        font-weight: bold;
-        font-size: 1.1em;
-    }
-    .status-error {
-        color: #FACC15;
-        font-weight: bold;
-        font-size: 1.1em;
-    }
-    .diff-added { color: #28a745; font-weight: bold; }
-    .diff-removed { color: #dc3545; font-weight: bold; }
-    .diff-context { color: #6c757d; }
-    .sidebar-header {
-        font-size: 1.2rem;
-        font-weight: bold;
-        color: #1f77b4;
-        margin-bottom: 1rem;
-        border-bottom: 2px solid #e9ecef;
-        padding-bottom: 0.5rem;
-    }
-    .module-card {
-        background: #ffffff;
-        border: 1px solid #dee2e6;
-        border-radius: 0.75rem;
-        padding: 1.5rem;
-        margin: 0.75rem 0;
-        transition: all 0.3s ease;
-    }
-    .module-card:hover {
-        border-color: #1f77b4;
-        box-shadow: 0 0.5rem 1rem rgba(31, 119, 180, 0.15);
-        transform: translateY(-1px);
-    }
-    .submodule-item {
-        background: #f8f9fa;
-        border: 1px solid #e9ecef;
-        border-radius: 0.5rem;
-        padding: 1rem;
-        margin: 0.5rem 0;
-    }
-    .tuning-controls {
-        background: linear-gradient(135deg, #e8f4f8, #f0f8ff);
-        border-radius: 1rem;
-        padding: 2rem;
-        margin: 1rem 0;
-        border: 1px solid #dee2e6;
-    }
-    .auto-tuner-result {
-        background: linear-gradient(135deg, #fff3cd, #ffeaa7);
-        border: 1px solid #ffeaa7;
-        border-radius: 0.75rem;
-        padding: 1.5rem;
-        margin: 1rem 0;
-    }
-    .diff-viewer {
-        background: #f8f9fa;
-        border: 1px solid #dee2e6;
-        border-radius: 0.5rem;
-        padding: 1rem;
-        font-family: 'Courier New', monospace;
-        font-size: 0.9em;
-        max-height: 400px;
-        overflow-y: auto;
-    }
-    .success-message {
-        background: linear-gradient(135deg, #d4edda, #c3e6cb);
-        border: 1px solid #c3e6cb;
-        color: #155724;
-        border-radius: 0.5rem;
-        padding: 1rem;
-        margin: 1rem 0;
-    }
-    .warning-message {
-        background: linear-gradient(135deg, #fff3cd, #ffeaa7);
-        border: 1px solid #ffeaa7;
-        color: #856404;
-        border-radius: 0.5rem;
-        padding: 1rem;
-        margin: 1rem 0;
-    }
-    .error-message {
-        background: linear-gradient(135deg, #f8d7da, #f5c6cb);
-        border: 1px solid #f5c6cb;
-        color: #721c24;
-        border-radius: 0.5rem;
-        padding: 1rem;
-        margin: 1rem 0;
-    }
-</style>
-""", unsafe_allow_html=True)
+STYLE_FILE = Path(__file__).resolve().parent / "assets" / "style.css"
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and formatting whitespace from a stylesheet"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r'\s*([{};,])\s*|(:)\s+', r'\1\2', css).strip()
+
+
+@st.cache_resource
+def _style_html() -> str:
+    """The page stylesheet as a minified <style> block, built once per server process"""
+    # The block is re-sent on every rerun, so it is kept as small as possible
+    return f"<style>{_minify_css(STYLE_FILE.read_text(encoding='utf-8'))}</style>"
+
+
+# Per-thread stack with one miss slot per tracked call in progress; a cached function's
+# body, which Streamlit only runs on a cache miss, marks the innermost slot
+_cache_calls = threading.local()
+
+
+def _tracked_cache_data(**cache_kwargs):
+    """st.cache_data that also counts hits, misses and call time per session in st.session_state["_cache_stats"]"""
+    def decorate(func):
+        @functools.wraps(func)
+        def compute(*args, **kwargs):
+            _cache_calls.stack[-1][0] = True
+            return func(*args, **kwargs)
+
+        cached = st.cache_data(**cache_kwargs)(compute)
+
+        @functools.wraps(func)
+        def call(*args, **kwargs):
+            stack = getattr(_cache_calls, "stack", None)
+            if stack is None:
+                stack = _cache_calls.stack = []
+            missed = [False]
+            stack.append(missed)
+            start = time.perf_counter()
+            try:
+                return cached(*args, **kwargs)
+            finally:
+                stack.pop()
+                stats = st.session_state.setdefault("_cache_stats", {}).setdefault(
+                    func.__name__, {"hits": 0, "misses": 0, "total_ms": 0.0}
+                )
+                stats["misses" if missed[0] else "hits"] += 1
+                stats["total_ms"] += (time.perf_counter() - start) * 1000
+
+        call.clear = cached.clear
+        return call
+    return decorate
+
+
+def _render_cache_stats():
+    """Hit/miss table for the cached loaders, for this session"""
+    stats = st.session_state.get("_cache_stats")
+    if not stats:
+        st.caption("No cached calls yet")
+        return
+    rows = []
+    for name, entry in sorted(stats.items()):
+        calls = entry["hits"] + entry["misses"]
+        rows.append({
+            "function": name,
+            "hits": entry["hits"],
+            "misses": entry["misses"],
+            "hit_ratio": f"{entry['hits'] / calls:.0%}",
+            "avg_ms": round(entry["total_ms"] / calls, 2),
+        })
+    st.dataframe(rows, use_container_width=True, hide_index=True)
+
+
+def status_once(name, remote=False):
+    """Binary status, looked up at most once per rerun however many panels show it"""
+    memo = st.session_state.setdefault("_status_memo", {})
+    key = ("remote" if remote else "local", name)
+    if key not in memo:
+        memo[key] = process_manager.get_remote_status(name) if remote else process_manager.get_status(name)
+    return memo[key]
 
 
 def main():
     """Main application"""
+    # Statuses are only shared within one rerun
+    st.session_state["_status_memo"] = {}
+    st.markdown(_style_html(), unsafe_allow_html=True)
 
     # Enhanced Grouped Navigation
     st.sidebar.markdown('<p class="sidebar-header">⚡ vuDataSim Web Interface</p>', unsafe_allow_html=True)
@@ -212,43 +167,15 @@ def main():
     # Main navigation sections
     section = st.sidebar.selectbox(
         "🧭 Main Sections",
-        ["🏠 Overview", "🧩 Configuration", "🖥️ Cluster Operations", "🧩 System", "🔮 Future"],
+        list(SECTIONS),
         index=0
     )
     
     st.sidebar.markdown("---")
     
     # Sub-navigation based on selected section
-    if section == "🏠 Overview":
-        page = st.sidebar.selectbox(
-            "Overview Pages",
-            ["Dashboard", "Live Metrics", "Audit & Logs"],
-            index=0
-        )
-    elif section == "🧩 Configuration":
-        page = st.sidebar.selectbox(
-            "Configuration Pages", 
-            ["Module Browser", "Submodule Editor", "EPS Tools", "Diff & Versioning"],
-            index=0
-        )
-    elif section == "🖥️ Cluster Operations":
-        page = st.sidebar.selectbox(
-            "Cluster Operations",
-            ["Cluster Manager", "Binary Control"],
-            index=0
-        )  
-    elif section == "🧩 System":
-        page = st.sidebar.selectbox(
-            "System Pages",
-            ["System Status", "Settings", "Audit Trail"],
-            index=0
-        )
-    elif section == "🔮 Future":
-        page = st.sidebar.selectbox(
-            "Future Features",
-            ["Real-time Analytics", "Alerts & Thresholds", "Template Library", "Config Testing", "Dark Mode"],
-            index=0
-        )
+    pages_label, section_pages = SECTIONS[section]
+    page = st.sidebar.selectbox(pages_label, list(section_pages), index=0)
     
     # Add breadcrumb navigation
     st.sidebar.markdown("---")
@@ -261,55 +188,54 @@ def main():
     col1, col2 = st.sidebar.columns(2)
     with col1:
         if st.button("🔄", help="Refresh Data"):
+            invalidate_module_caches()
+            _invalidate_binary_lists()
+            st.session_state.pop("_cache_stats", None)
             st.rerun()
     with col2:
         if st.button("⚙️", help="Global Settings"):
             st.session_state.show_global_settings = True
 
+    with st.sidebar.expander("📊 Cache stats"):
+        _render_cache_stats()
+
     st.sidebar.markdown("---")
 
     # Header
     st.markdown('<h1 class="main-header">⚡ vuDataSim Web Interface</h1>', unsafe_allow_html=True)
 
     # Route to appropriate page based on new structure
-    if page == "Dashboard":
-        show_dashboard()
-    elif page == "Live Metrics":
-        show_live_metrics()  # Enhanced Live EPS Monitor
-    elif page == "Audit & Logs":
-        show_audit_and_logs()  # Combined Logs & Audit
-    elif page == "Module Browser":
-        show_module_browser()
-    elif page == "Submodule Editor":
-        show_submodule_editor()
-    elif page == "EPS Tools":
-        show_eps_tools()  # Unified EPS workspace
-    elif page == "Diff & Versioning":
-        show_diff_and_versioning()  # Combined Diff & Backup
-    elif page == "Cluster Manager":
-        show_cluster_manager()
-    elif page == "Binary Control":
-        show_binary_control_hub()  # Combined local/remote
-    elif page == "System Status":
-        show_system_status()
-    elif page == "Settings":
-        show_global_settings()
-    elif page == "Audit Trail":
-        show_audit_trail()
-    elif page == "Real-time Analytics":
-        show_realtime_analytics()
-    elif page == "Alerts & Thresholds":
-        show_alerts_thresholds()
-    elif page == "Template Library":
-        show_template_library()
-    elif page == "Config Testing":
-        show_config_testing()
-    elif page == "Dark Mode":
-        show_dark_mode_settings()
+    handler = PAGES.get(page)
+    if handler:
+        handler()
     else:
         st.info(f"Select a page from the sidebar. Current: {page}")
 
 
+@_tracked_cache_data(ttl=5)
+def _dashboard_eps_snapshot():
+    """Total EPS and the top 5 modules by EPS, reused across reruns for a few seconds"""
+    all_eps = eps_calculator.calculate_eps_for_all_modules()
+    total_eps = sum(module.get("eps", 0) for module in all_eps.values())
+    module_eps = [(name, data.get("eps", 0)) for name, data in all_eps.items()]
+    module_eps.sort(key=lambda x: x[1], reverse=True)
+    return total_eps, module_eps[:5]
+
+
+@_tracked_cache_data(ttl=2)
+def _read_log_tail(log_path: str, mtime_ns: int, max_lines: int = 10, max_bytes: int = 8192):
+    """Last max_lines lines of a log, read from its final max_bytes; mtime_ns keys the cache"""
+    with open(log_path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        start = max(0, f.tell() - max_bytes)
+        f.seek(start)
+        lines = f.read().decode('utf-8', 'replace').splitlines()
+    # The first line is cut off unless the read began at the start of the file
+    if start and lines:
+        lines = lines[1:]
+    return lines[-max_lines:]
+
+
 def show_dashboard():
     """Main dashboard showing overview"""
     st.header("📊 Dashboard")
@@ -320,7 +246,7 @@ def show_dashboard():
     with col1:
         st.subheader("🔧 Binary Status")
         try:
-            status = process_manager.get_status(PRIMARY_BINARY)
+            status = status_once(PRIMARY_BINARY)
         except Exception as e:
             st.error(f"Error fetching binary status: {e}")
             status = {"status": "unknown"}
@@ -342,17 +268,13 @@ def show_dashboard():
     with col2:
         st.subheader("📈 EPS Overview")
         try:
-            all_eps = eps_calculator.calculate_eps_for_all_modules()
-            total_eps = sum(module.get("eps", 0) for module in all_eps.values())
+            total_eps, top_modules = _dashboard_eps_snapshot()
 
             st.metric("Total EPS", f"{total_eps:.1f}")
 
             # Show top modules by EPS
-            module_eps = [(name, data.get("eps", 0)) for name, data in all_eps.items()]
-            module_eps.sort(key=lambda x: x[1], reverse=True)
-
-            for module_name, eps in module_eps[:5]:  # Top 5
-                st.write(f"**{module_name}:** {eps:.1f} EPS")
+            if top_modules:
+                st.markdown("  \n".join(f"**{module_name}:** {eps:.1f} EPS" for module_name, eps in top_modules))
 
         except Exception as e:
             st.error(f"Error calculating EPS: {e}")
@@ -362,25 +284,50 @@ def show_dashboard():
     try:
         # Show recent log entries
         if LOG_FILE and Path(LOG_FILE).exists():
-            with open(LOG_FILE, 'r') as f:
-                lines = f.readlines()
-                recent_lines = lines[-10:]  # Last 10 lines
+            recent_lines = _read_log_tail(str(LOG_FILE), os.stat(LOG_FILE).st_mtime_ns)  # Last 10 lines
 
-            for line in reversed(recent_lines):
-                st.text(line.strip())
+            # One element for the whole block instead of one per line
+            st.code("\n".join(line.strip() for line in reversed(recent_lines)), language="log")
         else:
             st.info("No activity logs available yet.")
     except Exception as e:
         st.error(f"Error reading logs: {e}")
 
 
+# Seconds a binary listing is reused from session state before listing again
+BINARY_LIST_TTL = 10
+
+
+def _cached_binary_list(key):
+    """Binary listing stored in session state under key, or None once it is older than BINARY_LIST_TTL"""
+    if time.time() - st.session_state.get(f"{key}_ts", 0) > BINARY_LIST_TTL:
+        return None
+    return st.session_state.get(key)
+
+
+def _store_binary_list(key, binaries):
+    """Keep a binary listing in session state; empty listings are not kept so they are retried"""
+    if binaries:
+        st.session_state[key] = binaries
+        st.session_state[f"{key}_ts"] = time.time()
+
+
+def _invalidate_binary_lists():
+    """Make the next rerun list local and remote binaries again"""
+    st.session_state.pop("binaries_ts", None)
+    st.session_state.pop("remote_binaries_ts", None)
+
+
 def show_binary_control():
     """Binary control interface"""
     st.header("🎮 Binary Control")
 
     # Binary selection
     try:
-        available_binaries = process_manager.list_binaries()
+        available_binaries = _cached_binary_list("binaries")
+        if available_binaries is None:
+            available_binaries = process_manager.list_binaries()
+            _store_binary_list("binaries", available_binaries)
     except Exception as e:
         st.error(f"Error listing binaries: {e}")
         return
@@ -401,12 +348,13 @@ def show_binary_control():
     )
 
     # Current status
-    status = process_manager.get_status(binary_name)
+    status = status_once(binary_name)
 
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
         if st.button("🔄 Refresh Status"):
+            _invalidate_binary_lists()
             st.rerun()
 
     with col2:
@@ -476,19 +424,88 @@ def show_binary_control():
         st.info("Binary is not currently running")
 
 
+@_tracked_cache_data(ttl=3)
+def _remote_log_tail(binary_name, max_bytes):
+    """Tail of a remote binary's log, reused for a few seconds across reruns"""
+    return process_manager.get_remote_logs(binary_name, max_bytes)
+
+
+def _render_remote_status(status):
+    """Status details for a remote binary"""
+    if status.get("status") == "running":
+        st.markdown(f'<p class="status-running">● Running (Remote)</p>', unsafe_allow_html=True)
+        st.json({
+            "PID": status.get("pid"),
+            "Run ID": status.get("run_id"),
+            "Start Time": status.get("start_time"),
+            "Elapsed": f"{status.get('elapsed_seconds', 0):.1f}s",
+            "Remote Log File": status.get("remote_log_file"),
+            "Host": REMOTE_HOST
+        })
+    elif status.get("status") == "exited":
+        st.markdown(f'<p class="status-stopped">● Exited (Remote)</p>', unsafe_allow_html=True)
+        st.json({
+            "Run ID": status.get("run_id"),
+            "Start Time": status.get("start_time"),
+            "Elapsed": f"{status.get('elapsed_seconds', 0):.1f}s",
+            "Remote Log File": status.get("remote_log_file"),
+            "Host": REMOTE_HOST
+        })
+    elif status.get("status") == "timeout":
+        st.markdown(f'<p class="status-error">● Timeout (Remote)</p>', unsafe_allow_html=True)
+        st.json({
+            "PID": status.get("pid"),
+            "Run ID": status.get("run_id"),
+            "Start Time": status.get("start_time"),
+            "Elapsed": f"{status.get('elapsed_seconds', 0):.1f}s",
+            "Timeout": f"{status.get('timeout', 0)}s",
+            "Host": REMOTE_HOST
+        })
+    else:
+        st.info("Remote binary is not currently running")
+
+
+def _remote_status_fragment(binary_name, page_status):
+    """Periodically refreshed remote status; reruns the page once the state changes"""
+    # During a full page run the page has just fetched the status; only timer ticks query again
+    if st.session_state.pop("_remote_status_from_page", False):
+        _render_remote_status(page_status)
+        return
+    try:
+        status = process_manager.get_remote_status(binary_name)
+    except Exception as e:
+        status = {"status": "error", "message": str(e)}
+    # The Start/Stop buttons outside the fragment depend on the state
+    if status.get("status") != page_status.get("status"):
+        st.rerun()
+    _render_remote_status(status)
+
+
 def show_remote_binary_control():
     """Remote binary control interface"""
     st.header("🌐 Remote Binary Control")
 
     st.info(f"📡 Connected to remote host: {REMOTE_HOST}")
 
-    # Remote binary selection
-    try:
-        available_remote_binaries = process_manager.list_remote_binaries()
-    except Exception as e:
-        st.error(f"Error connecting to remote host: {e}")
-        st.error("Please check SSH configuration and network connectivity")
-        return
+    # List the remote binaries and check the previously selected one at the same time
+    previous_choice = st.session_state.get("remote_binary_choice")
+    prefetched_binary = previous_choice.replace("🔗 ", "") if previous_choice else None
+    available_remote_binaries = _cached_binary_list("remote_binaries")
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        binaries_future = (pool.submit(process_manager.list_remote_binaries)
+                           if available_remote_binaries is None else None)
+        status_future = (pool.submit(process_manager.get_remote_status, prefetched_binary)
+                         if prefetched_binary else None)
+
+        # Remote binary selection
+        try:
+            if binaries_future is not None:
+                available_remote_binaries = binaries_future.result()
+                _store_binary_list("remote_binaries", available_remote_binaries)
+        except Exception as e:
+            st.error(f"Error connecting to remote host: {e}")
+            st.error("Please check SSH configuration and network connectivity")
+            return
 
     if not available_remote_binaries:
         st.error("No binaries found in remote bin/ directory")
@@ -499,7 +516,8 @@ def show_remote_binary_control():
 
     binary_name = st.selectbox(
         "Select Remote Binary",
-        remote_options
+        remote_options,
+        key="remote_binary_choice"
     )
 
     # Remove the emoji prefix for actual binary name
@@ -507,7 +525,10 @@ def show_remote_binary_control():
 
     # Current status with error handling
     try:
-        status = process_manager.get_remote_status(actual_binary_name)
+        if status_future is not None and prefetched_binary == actual_binary_name:
+            status = status_future.result()
+        else:
+            status = status_once(actual_binary_name, remote=True)
     except Exception as e:
         st.error(f"Error getting remote status: {e}")
         status = {"status": "error", "message": str(e)}
@@ -516,9 +537,8 @@ def show_remote_binary_control():
 
     with col1:
         auto_refresh = st.checkbox("🔄 Auto-refresh", value=False, help="Automatically refresh status every 3 seconds")
-        if st.button("🔄 Refresh Status") or auto_refresh:
-            if auto_refresh:
-                time.sleep(3)
+        if st.button("🔄 Refresh Status"):
+            _invalidate_binary_lists()
             st.rerun()
 
     with col2:
@@ -562,43 +582,19 @@ def show_remote_binary_control():
 
     # Status details
     st.subheader("📊 Current Status")
-    if status.get("status") == "running":
-        st.markdown(f'<p class="status-running">● Running (Remote)</p>', unsafe_allow_html=True)
-        st.json({
-            "PID": status.get("pid"),
-            "Run ID": status.get("run_id"),
-            "Start Time": status.get("start_time"),
-            "Elapsed": f"{status.get('elapsed_seconds', 0):.1f}s",
-            "Remote Log File": status.get("remote_log_file"),
-            "Host": REMOTE_HOST
-        })
-    elif status.get("status") == "exited":
-        st.markdown(f'<p class="status-stopped">● Exited (Remote)</p>', unsafe_allow_html=True)
-        st.json({
-            "Run ID": status.get("run_id"),
-            "Start Time": status.get("start_time"),
-            "Elapsed": f"{status.get('elapsed_seconds', 0):.1f}s",
-            "Remote Log File": status.get("remote_log_file"),
-            "Host": REMOTE_HOST
-        })
-    elif status.get("status") == "timeout":
-        st.markdown(f'<p class="status-error">● Timeout (Remote)</p>', unsafe_allow_html=True)
-        st.json({
-            "PID": status.get("pid"),
-            "Run ID": status.get("run_id"),
-            "Start Time": status.get("start_time"),
-            "Elapsed": f"{status.get('elapsed_seconds', 0):.1f}s",
-            "Timeout": f"{status.get('timeout', 0)}s",
-            "Host": REMOTE_HOST
-        })
+    if auto_refresh:
+        # Only the status block re-runs on the timer, not the whole page
+        st.session_state["_remote_status_from_page"] = True
+        st.fragment(_remote_status_fragment, run_every=3)(actual_binary_name, status)
     else:
-        st.info("Remote binary is not currently running")
+        _render_remote_status(status)
 
     # Show remote logs if requested
     if st.session_state.get("show_remote_logs", False):
         st.subheader("📜 Remote Binary Logs")
+        max_bytes = st.session_state.get("remote_log_bytes", REMOTE_LOG_TAIL_BYTES)
         try:
-            logs = process_manager.get_remote_logs(actual_binary_name)
+            logs = _remote_log_tail(actual_binary_name, max_bytes)
             if logs:
                 st.code(logs, language="log")
             else:
@@ -606,9 +602,16 @@ def show_remote_binary_control():
         except Exception as e:
             st.error(f"Error retrieving logs: {e}")
 
-        if st.button("🔙 Back to Control"):
-            st.session_state.show_remote_logs = False
-            st.rerun()
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("⏫ Load More"):
+                st.session_state.remote_log_bytes = max_bytes * 2
+                st.rerun()
+        with col2:
+            if st.button("🔙 Back to Control"):
+                st.session_state.show_remote_logs = False
+                st.session_state.pop("remote_log_bytes", None)
+                st.rerun()
 
 
 def show_cluster_manager():
@@ -654,13 +657,31 @@ def show_cluster_manager():
         render_eps_calculator()
 
 
+@_tracked_cache_data(max_entries=8)
+def _read_main_cached(mtime_ns: int, size: int):
+    """yaml_editor.read_main_config(); the file's mtime and size key the cache"""
+    return yaml_editor.read_main_config()
+
+
+def read_main_config_cached():
+    """Main config and checksum, parsed again only when conf.yml changes on disk"""
+    stat = MAIN_CONFIG_FILE.stat()
+    return _read_main_cached(stat.st_mtime_ns, stat.st_size)
+
+
+@_tracked_cache_data(ttl=10)
+def _all_modules_eps():
+    """EPS for every module from one batched calculation, reused across reruns for a few seconds"""
+    return eps_calculator.calculate_eps_for_all_modules()
+
+
 def show_module_browser():
     """Module browser interface"""
     st.header("📁 Module Browser")
 
     try:
         # Read main config to get module status
-        main_config, checksum = yaml_editor.read_main_config()
+        main_config, checksum = read_main_config_cached()
 
         if "include_module_dirs" not in main_config:
             st.error("No include_module_dirs section found in main config")
@@ -676,56 +697,117 @@ def show_module_browser():
 
         # Display modules
         st.subheader("📋 Available Modules")
+        all_eps = _all_modules_eps()
 
-        for module_name, module_config in modules.items():
-            is_enabled = module_config.get("enabled", False)
+        # All toggles go into one form so that saving is a single rerun and a single write
+        shown_modules = []
+        with st.form("modules"):
+            for module_name, module_config in modules.items():
+                is_enabled = module_config.get("enabled", False)
 
-            if show_only_enabled and not is_enabled:
-                continue
+                if show_only_enabled and not is_enabled:
+                    continue
+                shown_modules.append(module_name)
 
-            with st.expander(f"{'✅' if is_enabled else '❌'} {module_name} ({'Enabled' if is_enabled else 'Disabled'})"):
-                col1, col2 = st.columns([2, 1])
+                with st.expander(f"{'✅' if is_enabled else '❌'} {module_name} ({'Enabled' if is_enabled else 'Disabled'})"):
+                    col1, col2 = st.columns([2, 1])
 
-                with col1:
-                    st.write(f"**Status:** {'Enabled' if is_enabled else 'Disabled'}")
+                    with col1:
+                        st.write(f"**Status:** {'Enabled' if is_enabled else 'Disabled'}")
 
-                    # Quick toggle
-                    new_status = st.checkbox(
-                        "Enable/Disable",
-                        value=is_enabled,
-                        key=f"toggle_{module_name}"
-                    )
+                        # Quick toggle
+                        st.checkbox(
+                            "Enable/Disable",
+                            value=is_enabled,
+                            key=f"toggle_{module_name}"
+                        )
 
-                    if new_status != is_enabled:
-                        if st.button("💾 Save Toggle", key=f"save_toggle_{module_name}"):
-                            try:
-                                result = yaml_editor.toggle_module_enabled(module_name, new_status, checksum)
-                                if result.get("success"):
-                                    st.success(f"Module {module_name} {'enabled' if new_status else 'disabled'}")
-                                    st.rerun()
-                                else:
-                                    st.error(f"Failed to toggle module: {result.get('error')}")
-                            except Exception as e:
-                                st.error(f"Error toggling module: {e}")
-
-                with col2:
-                    # Show EPS info if available
-                    try:
-                        eps_data = eps_calculator.calculate_eps(module_name)
-                        st.metric("Current EPS", f"{eps_data.get('eps', 0):.1f}")
-                    except Exception as e:
-                        st.write(f"EPS: Error calculating ({e})")
+                    with col2:
+                        # Show EPS info if available
+                        eps_data = all_eps.get(module_name, {"error": f"no conf.yml found for {module_name}"})
+                        if "error" in eps_data:
+                            st.write(f"EPS: Error calculating ({eps_data['error']})")
+                        else:
+                            st.metric("Current EPS", f"{eps_data.get('eps', 0):.1f}")
+
+            submitted = st.form_submit_button("💾 Save All Toggles")
+
+        if submitted:
+            toggles = {}
+            for module_name in shown_modules:
+                new_status = st.session_state.get(f"toggle_{module_name}")
+                if new_status is not None and new_status != modules[module_name].get("enabled", False):
+                    toggles[module_name] = new_status
+
+            if not toggles:
+                st.info("No module changes to save")
+            else:
+                try:
+                    result = yaml_editor.toggle_modules_bulk(toggles, checksum)
+                    if result.get("success"):
+                        _read_main_cached.clear()
+                        st.success(f"Updated {len(toggles)} module(s)")
+                        st.rerun()
+                    else:
+                        st.error(f"Failed to toggle modules: {result.get('error')}")
+                except Exception as e:
+                    st.error(f"Error toggling modules: {e}")
 
     except Exception as e:
         st.error(f"Error reading module configuration: {e}")
 
 
+@_tracked_cache_data(ttl=30)
+def _module_list(dir_mtime_ns: int):
+    """eps_calculator.get_module_list(); conf.d's mtime keys the cache"""
+    return eps_calculator.get_module_list()
+
+
+def get_module_list_cached():
+    """Module names, rescanned when conf.d changes or after 30 seconds"""
+    try:
+        mtime_ns = CONF_D_DIR.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    return _module_list(mtime_ns)
+
+
+@_tracked_cache_data(ttl=30, max_entries=256)
+def _module_config(module_name: str, mtime_ns: int, size: int):
+    """eps_calculator.get_module_config(); the module conf.yml's mtime and size key the cache"""
+    return eps_calculator.get_module_config(module_name)
+
+
+def get_module_config_cached(module_name):
+    """Module uniquekey/period settings, parsed again only when its conf.yml changes"""
+    try:
+        stat = (CONF_D_DIR / module_name / "conf.yml").stat()
+        mtime_ns, size = stat.st_mtime_ns, stat.st_size
+    except OSError:
+        mtime_ns, size = 0, 0
+    return _module_config(module_name, mtime_ns, size)
+
+
+def invalidate_module_list():
+    """Drop the cached module list and module configs, e.g. after modules are added or removed"""
+    _module_list.clear()
+    _module_config.clear()
+
+
+def invalidate_module_caches():
+    """Drop all cached module data after a module config write, so EPS views show the new values"""
+    invalidate_module_list()
+    _all_modules_eps.clear()
+    _dashboard_eps_snapshot.clear()
+    _enabled_module_topics_cached.clear()
+
+
 def show_eps_tuner():
     """EPS tuning interface"""
     st.header("🎯 EPS Tuner")
 
     # Module selection
-    modules = eps_calculator.get_module_list()
+    modules = get_module_list_cached()
     if not modules:
         st.error("No modules found")
         return
@@ -735,7 +817,7 @@ def show_eps_tuner():
     if selected_module:
         # Get current configuration
         eps_data = eps_calculator.calculate_eps(selected_module)
-        module_config = eps_calculator.get_module_config(selected_module)
+        module_config = get_module_config_cached(selected_module)
 
         # Current EPS display
         st.subheader(f"📊 Current Configuration - {selected_module}")
@@ -826,7 +908,7 @@ def show_config_editor():
     st.header("⚙️ Configuration Editor")
 
     # Module selection for editing
-    modules = eps_calculator.get_module_list()
+    modules = get_module_list_cached()
 
     if not modules:
         st.info("No modules found for editing")
@@ -933,6 +1015,7 @@ def show_config_editor():
                             st.error(f"❌ Failed to update period: {result.get('error')}")
 
                     if changes_made:
+                        invalidate_module_caches()
                         st.rerun()
 
                 except Exception as e:
@@ -947,7 +1030,7 @@ def show_submodule_editor():
     st.header("🔧 Submodule Editor")
 
     # Module selection
-    modules = eps_calculator.get_module_list()
+    modules = get_module_list_cached()
     if not modules:
         st.info("No modules found")
         return
@@ -995,6 +1078,7 @@ def show_submodule_editor():
                                     )
                                     if result.get("success"):
                                         st.success(f"✅ {submodule_name} updated successfully")
+                                        invalidate_module_caches()
                                         st.rerun()
                                     else:
                                         st.error(f"❌ Failed to update {submodule_name}")
@@ -1012,7 +1096,7 @@ def show_auto_tuner():
     st.header("🎯 Auto-Tuner")
 
     # Module selection
-    modules = eps_calculator.get_module_list()
+    modules = get_module_list_cached()
     if not modules:
         st.info("No modules found")
         return
@@ -1097,8 +1181,12 @@ def show_auto_tuner():
                             st.write(f"Expected: {suggestion.get('expected_eps', 0):.1f}")
 
                         st.write("**Submodule Contributions:**")
-                        for submodule_name, config in suggestion.get('submodule_configs', {}).items():
-                            st.write(f"• {submodule_name}: {config.get('current_uniquekey', 0)} keys")
+                        contributions = suggestion.get('submodule_configs', {})
+                        if contributions:
+                            st.markdown("  \n".join(
+                                f"• {submodule_name}: {config.get('current_uniquekey', 0)} keys"
+                                for submodule_name, config in contributions.items()
+                            ))
 
                     # Apply suggestion
                     if st.button("✅ Apply Suggestion"):
@@ -1113,6 +1201,7 @@ def show_auto_tuner():
 
                             if result.get("success"):
                                 st.success("🎉 Configuration updated successfully!")
+                                invalidate_module_caches()
                                 st.rerun()
                             else:
                                 st.error(f"❌ Failed to apply changes: {result.get('error')}")
@@ -1129,7 +1218,7 @@ def show_diff_preview():
     st.header("🔍 Diff Preview")
 
     # Module selection
-    modules = eps_calculator.get_module_list()
+    modules = get_module_list_cached()
     if not modules:
         st.info("No modules found")
         return
@@ -1216,6 +1305,7 @@ def show_diff_preview():
                                 else:
                                     st.error(f"❌ Failed to update period: {result.get('error')}")
 
+                            invalidate_module_caches()
                             st.rerun()
 
                         except Exception as e:
@@ -1363,7 +1453,7 @@ def show_system_status():
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        st.metric("Total Modules", len(eps_calculator.get_module_list()))
+        st.metric("Total Modules", len(get_module_list_cached()))
 
     with col2:
         # Calculate total EPS
@@ -1392,7 +1482,7 @@ def show_system_status():
 
     with status_tabs[0]:
         st.write("**Module Status:**")
-        modules = eps_calculator.get_module_list()
+        modules = get_module_list_cached()
 
         if modules:
             # Create summary table
@@ -1430,7 +1520,7 @@ def show_system_status():
 
         if binaries:
             for binary in binaries:
-                status = process_manager.get_status(binary)
+                status = status_once(binary)
 
                 if status.get("status") == "running":
                     st.success(f"✅ {binary}: Running (PID {status.get('pid', 'N/A')})")
@@ -1444,7 +1534,7 @@ def show_system_status():
     with status_tabs[2]:
         st.write("**Configuration Status:**")
         try:
-            main_config, checksum = yaml_editor.read_main_config()
+            main_config, checksum = read_main_config_cached()
             enabled_count = sum(1 for m in main_config.get("include_module_dirs", {}).values()
                               if m.get("enabled", False))
             total_count = len(main_config.get("include_module_dirs", {}))
@@ -1455,6 +1545,32 @@ def show_system_status():
             st.error(f"❌ Main config: Error reading ({e})")
 
 
+@_tracked_cache_data(ttl=30, max_entries=8)
+def _enabled_module_topics_cached(mtime_ns: int, size: int):
+    """(module, Kafka topic) pairs; conf.yml's mtime and size key the cache"""
+    main_config, _ = read_main_config_cached()
+    modules = main_config.get("include_module_dirs", {})
+
+    # Extract enabled modules and their topics
+    available_topics = []
+    for module_name, module_config in modules.items():
+        if module_config.get("enabled", False):
+            try:
+                module_config_data, _ = yaml_editor.read_module_config(module_name)
+                topic = module_config_data.get("output", {}).get("kafka", {}).get("topic")
+                if topic:
+                    available_topics.append((module_name, topic))
+            except Exception:
+                continue
+    return available_topics
+
+
+def _enabled_module_topics():
+    """(module, Kafka topic) pairs for the enabled modules that publish to Kafka"""
+    stat = MAIN_CONFIG_FILE.stat()
+    return _enabled_module_topics_cached(stat.st_mtime_ns, stat.st_size)
+
+
 def show_live_eps_monitor():
     """Live EPS monitoring interface"""
     st.header("📊 Live EPS Monitor")
@@ -1484,20 +1600,7 @@ def show_live_eps_monitor():
 
     # Get available modules and their topics
     try:
-        main_config, _ = yaml_editor.read_main_config()
-        modules = main_config.get("include_module_dirs", {})
-
-        # Extract enabled modules and their topics
-        available_topics = []
-        for module_name, module_config in modules.items():
-            if module_config.get("enabled", False):
-                try:
-                    module_config_data, _ = yaml_editor.read_module_config(module_name)
-                    topic = module_config_data.get("output", {}).get("kafka", {}).get("topic")
-                    if topic:
-                        available_topics.append((module_name, topic))
-                except Exception:
-                    continue
+        available_topics = _enabled_module_topics()
 
         if available_topics:
             topic_options = [f"{module} ({topic})" for module, topic in available_topics]
@@ -1522,57 +1625,47 @@ def show_live_eps_monitor():
         if st.button("🔍 Query Current EPS", type="primary"):
             with st.spinner("Connecting to ClickHouse..."):
                 try:
-                    # Connect and query
-                    if clickhouse_monitor.connect():
-                        success, eps_value, message = clickhouse_monitor.get_eps_for_topic(selected_topic)
+                    # The monitor keeps its connection open and reconnects on demand
+                    success, eps_value, message = get_clickhouse_monitor().get_eps_for_topic(selected_topic)
 
-                        if success:
-                            st.success(f"✅ Current EPS for topic '{selected_topic}': **{eps_value:.2f}**")
-                            st.metric("Live EPS", f"{eps_value:.2f}")
-                        else:
-                            st.error(f"❌ Failed to get EPS: {message}")
+                    if success:
+                        st.success(f"✅ Current EPS for topic '{selected_topic}': **{eps_value:.2f}**")
+                        st.metric("Live EPS", f"{eps_value:.2f}")
                     else:
-                        st.error("❌ Failed to connect to ClickHouse server")
+                        st.error(f"❌ Failed to get EPS: {message}")
 
                 except Exception as e:
                     st.error(f"❌ Error: {e}")
-                finally:
-                    clickhouse_monitor.disconnect()
 
     with col2:
         if st.button("📊 Get Detailed Metrics"):
             with st.spinner("Fetching detailed metrics..."):
                 try:
-                    if clickhouse_monitor.connect():
-                        success, metrics, message = clickhouse_monitor.get_topic_metrics(selected_topic)
+                    success, metrics, message = get_clickhouse_monitor().get_topic_metrics(selected_topic)
 
-                        if success:
-                            st.success(f"✅ Detailed metrics for topic '{selected_topic}'")
+                    if success:
+                        st.success(f"✅ Detailed metrics for topic '{selected_topic}'")
 
-                            # Display metrics in columns
-                            col1, col2, col3 = st.columns(3)
+                        # Display metrics in columns
+                        col1, col2, col3 = st.columns(3)
 
-                            with col1:
-                                st.metric("1-Minute Rate", f"{metrics['one_minute_rate']:.2f}")
-                                st.metric("5-Minute Rate", f"{metrics['five_minute_rate']:.2f}")
+                        with col1:
+                            st.metric("1-Minute Rate", f"{metrics['one_minute_rate']:.2f}")
+                            st.metric("5-Minute Rate", f"{metrics['five_minute_rate']:.2f}")
 
-                            with col2:
-                                st.metric("15-Minute Rate", f"{metrics['fifteen_minute_rate']:.2f}")
-                                st.metric("Mean Rate", f"{metrics['mean_rate']:.2f}")
+                        with col2:
+                            st.metric("15-Minute Rate", f"{metrics['fifteen_minute_rate']:.2f}")
+                            st.metric("Mean Rate", f"{metrics['mean_rate']:.2f}")
 
-                            with col3:
-                                st.metric("Total Count", f"{metrics['count']:,.0f}")
-                                st.write(f"**Last Updated:** {metrics['timestamp']}")
+                        with col3:
+                            st.metric("Total Count", f"{metrics['count']:,.0f}")
+                            st.write(f"**Last Updated:** {metrics['timestamp']}")
 
-                        else:
-                            st.error(f"❌ Failed to get metrics: {message}")
                     else:
-                        st.error("❌ Failed to connect to ClickHouse server")
+                        st.error(f"❌ Failed to get metrics: {message}")
 
                 except Exception as e:
                     st.error(f"❌ Error: {e}")
-                finally:
-                    clickhouse_monitor.disconnect()
 
     with col3:
         auto_refresh = st.checkbox("Auto-refresh every 30 seconds", value=False)
@@ -1622,7 +1715,28 @@ def show_live_metrics():
     with tab2:
         st.subheader("📊 ClickHouse Metrics")
         st.info("Real-time database metrics and performance indicators")
-        # Add ClickHouse specific metrics here
+        try:
+            topics = _enabled_module_topics()
+        except Exception as e:
+            st.error(f"Error loading modules: {e}")
+            topics = []
+
+        if not topics:
+            st.warning("No enabled modules with Kafka topics found")
+        elif st.button("📥 Load EPS for Enabled Topics"):
+            with st.spinner("Querying ClickHouse..."):
+                # One grouped query; ClickHouse picks the latest rate per topic server-side
+                success, eps_by_topic, message = get_clickhouse_monitor().get_eps_for_topics(
+                    [topic for _, topic in topics]
+                )
+            if success:
+                st.metric("Total EPS", f"{sum(eps_by_topic.values()):.2f}")
+                st.dataframe(
+                    [{"Module": module, "Topic": topic, "EPS": eps_by_topic.get(topic)} for module, topic in topics],
+                    use_container_width=True
+                )
+            else:
+                st.error(f"❌ Failed to get EPS: {message}")
         
     with tab3:
         st.subheader("🔄 Auto-Refresh Settings")
@@ -1822,10 +1936,12 @@ def show_realtime_analytics():
     st.header("📊 Real-time Analytics")
     st.info("🚧 Coming Soon: Advanced analytics and performance insights")
     st.markdown("**Planned Features:**")
-    st.markdown("- Historical EPS trends")
-    st.markdown("- Performance heatmaps")
-    st.markdown("- Predictive analytics")
-    st.markdown("- Custom dashboards")
+    st.markdown("\n".join([
+        "- Historical EPS trends",
+        "- Performance heatmaps",
+        "- Predictive analytics",
+        "- Custom dashboards",
+    ]))
 
 
 def show_alerts_thresholds():
@@ -1833,10 +1949,12 @@ def show_alerts_thresholds():
     st.header("🚨 Alerts & Thresholds")
     st.info("🚧 Coming Soon: Intelligent alerting system")
     st.markdown("**Planned Features:**")
-    st.markdown("- EPS threshold alerts")
-    st.markdown("- Node health monitoring")
-    st.markdown("- Email/Slack notifications")
-    st.markdown("- Custom alert rules")
+    st.markdown("\n".join([
+        "- EPS threshold alerts",
+        "- Node health monitoring",
+        "- Email/Slack notifications",
+        "- Custom alert rules",
+    ]))
 
 
 def show_template_library():
@@ -1844,10 +1962,12 @@ def show_template_library():
     st.header("🧱 Template Library")
     st.info("🚧 Coming Soon: Reusable configuration templates")
     st.markdown("**Planned Features:**")
-    st.markdown("- Pre-built module templates")
-    st.markdown("- Custom template creation")
-    st.markdown("- Template versioning")
-    st.markdown("- Community template sharing")
+    st.markdown("\n".join([
+        "- Pre-built module templates",
+        "- Custom template creation",
+        "- Template versioning",
+        "- Community template sharing",
+    ]))
 
 
 def show_config_testing():
@@ -1855,10 +1975,12 @@ def show_config_testing():
     st.header("🧪 Config Testing")
     st.info("🚧 Coming Soon: Automated configuration testing")
     st.markdown("**Planned Features:**")
-    st.markdown("- YAML syntax validation")
-    st.markdown("- Logic consistency checks")
-    st.markdown("- Performance impact simulation")
-    st.markdown("- Automated test suites")
+    st.markdown("\n".join([
+        "- YAML syntax validation",
+        "- Logic consistency checks",
+        "- Performance impact simulation",
+        "- Automated test suites",
+    ]))
 
 
 def show_dark_mode_settings():
@@ -1866,10 +1988,49 @@ def show_dark_mode_settings():
     st.header("🌓 Dark Mode")
     st.info("🚧 Coming Soon: Dark theme support")
     st.markdown("**Planned Features:**")
-    st.markdown("- Dark/Light theme toggle")
-    st.markdown("- Custom color schemes")
-    st.markdown("- High contrast mode")
-    st.markdown("- Theme scheduling")
+    st.markdown("\n".join([
+        "- Dark/Light theme toggle",
+        "- Custom color schemes",
+        "- High contrast mode",
+        "- Theme scheduling",
+    ]))
+
+
+# Sidebar sections: (page selector label, {page: renderer}), in display order
+SECTIONS: Dict[str, Tuple[str, Dict[str, Callable[[], None]]]] = {
+    "🏠 Overview": ("Overview Pages", {
+        "Dashboard": show_dashboard,
+        "Live Metrics": show_live_metrics,  # Enhanced Live EPS Monitor
+        "Audit & Logs": show_audit_and_logs,  # Combined Logs & Audit
+    }),
+    "🧩 Configuration": ("Configuration Pages", {
+        "Module Browser": show_module_browser,
+        "Submodule Editor": show_submodule_editor,
+        "EPS Tools": show_eps_tools,  # Unified EPS workspace
+        "Diff & Versioning": show_diff_and_versioning,  # Combined Diff & Backup
+    }),
+    "🖥️ Cluster Operations": ("Cluster Operations", {
+        "Cluster Manager": show_cluster_manager,
+        "Binary Control": show_binary_control_hub,  # Combined local/remote
+    }),
+    "🧩 System": ("System Pages", {
+        "System Status": show_system_status,
+        "Settings": show_global_settings,
+        "Audit Trail": show_audit_trail,
+    }),
+    "🔮 Future": ("Future Features", {
+        "Real-time Analytics": show_realtime_analytics,
+        "Alerts & Thresholds": show_alerts_thresholds,
+        "Template Library": show_template_library,
+        "Config Testing": show_config_testing,
+        "Dark Mode": show_dark_mode_settings,
+    }),
+}
+
+# Page name -> renderer, for routing
+PAGES: Dict[str, Callable[[], None]] = {
+    page: handler for _, pages in SECTIONS.values() for page, handler in pages.items()
+}
 
 
 if __name__ == "__main__":
@@ -9,7 +9,7 @@ import yaml
 import time
 from datetime import datetime
 
-from core.cluster_manager import get_cluster_manager, NodeConnectionError, ConfigSyncError
+from core.cluster_manager import get_cluster_manager, NodeConnectionError, ConfigSyncError, SafeLoader, SafeDumper
 from core.yaml_editor import yaml_editor
 
 logger = logging.getLogger(__name__)
@@ -449,7 +449,8 @@ def render_push_status():
                 with col1:
                     st.metric("Files Pushed", f"{result['files_pushed']}/{result['total_files']}")
                 with col2:
-                    success_rate = (result['files_pushed'] / result['total_files'] * 100) if result['total_files'] > 0 else 0
+                    files_ok = result['files_pushed'] + result.get('files_skipped', 0)
+                    success_rate = (files_ok / result['total_files'] * 100) if result['total_files'] > 0 else 0
                     st.metric("Success Rate", f"{success_rate:.1f}%")
                 with col3:
                     st.metric("Failed Files", len(result.get('failed_files', [])))
@@ -468,6 +469,8 @@ def render_push_status():
                 
                 if result['success'] and result['files_pushed'] > 0:
                     st.success(f"✅ Successfully pushed {result['files_pushed']} configuration files to {node_name}")
+                if result.get('files_skipped'):
+                    st.info(f"ℹ️ {result['files_skipped']} files were already up to date on {node_name}")
     
     # Clear results button
     if st.button("Clear Push Results"):
@@ -571,7 +574,7 @@ def render_config_editor(node_name: str, file_path: Path):
         with col3:
             if st.button("🔧 Validate YAML"):
                 try:
-                    yaml.safe_load(edited_content)
+                    yaml.load(edited_content, Loader=SafeLoader)
                     st.success("✅ YAML is valid!")
                 except yaml.YAMLError as e:
                     st.error(f"❌ YAML validation failed: {e}")
@@ -594,7 +597,7 @@ def render_config_editor(node_name: str, file_path: Path):
 def render_eps_calculator_for_config(yaml_content: str):
     """Render EPS calculator for the current configuration"""
     try:
-        config_data = yaml.safe_load(yaml_content)
+        config_data = yaml.load(yaml_content, Loader=SafeLoader)
         
         # Look for EPS-relevant parameters
         if isinstance(config_data, dict):
@@ -1347,7 +1350,7 @@ def render_eps_calculator():
                 
                 st.download_button(
                     label="💾 Download EPS Report (JSON)",
-                    data=yaml.dump(export_data, default_flow_style=False),
+                    data=yaml.dump(export_data, Dumper=SafeDumper, default_flow_style=False),
                     file_name=f"eps_report_{selected_node}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.yaml",
                     mime="application/x-yaml"
                 )
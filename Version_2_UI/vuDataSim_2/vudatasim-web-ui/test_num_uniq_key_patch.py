@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Regression checks for the in-place NumUniqKey rewrite used by bulk edits
+"""
+import sys
+from pathlib import Path
+
+# Add the src directory to path
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from core.cluster_manager import _patch_num_uniq_key
+
+
+def _doc(value: str) -> bytes:
+    return f"uniquekey:\n  name: \"k\"\n  NumUniqKey: {value}\n\nperiod: 1s\n".encode()
+
+
+def test_plain_integer_is_patched():
+    assert _patch_num_uniq_key(_doc("10"), 500) == _doc("500")
+
+
+def test_trailing_comment_and_crlf_are_kept():
+    assert _patch_num_uniq_key(_doc("10   # keys"), 500) == _doc("500   # keys")
+    crlf = b"uniquekey:\r\n  NumUniqKey: 10\r\nperiod: 1s\r\n"
+    assert _patch_num_uniq_key(crlf, 500) == b"uniquekey:\r\n  NumUniqKey: 500\r\nperiod: 1s\r\n"
+
+
+def test_other_value_shapes_fall_back():
+    # Splicing only the leading digits would turn these into 500x10, 500.5, 500_000, ...
+    for value in ("0x10", "1.5", "1_000", "10#x", "1e3", "10 keys", "'10'"):
+        assert _patch_num_uniq_key(_doc(value), 500) is None, value
+
+
+if __name__ == "__main__":
+    test_plain_integer_is_patched()
+    test_trailing_comment_and_crlf_are_kept()
+    test_other_value_shapes_fall_back()
+    print("✅ NumUniqKey patch checks passed")